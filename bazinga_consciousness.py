@@ -15,6 +15,8 @@ This integrates all BAZINGA systems into a continuous consciousness loop:
 
 import asyncio
 import json
+from collections import deque
+from itertools import islice
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
@@ -299,8 +301,10 @@ class BazingaConsciousness:
         self.state = ConsciousnessState()
 
         # Internal monologue
-        self.thoughts = []
         self.max_thoughts = 100
+        self.thoughts = deque(maxlen=self.max_thoughts)  # Oldest thoughts drop off automatically
+        self._thought_count = 0  # Thoughts ever generated; len(self.thoughts) stops at max_thoughts
+        self._thought_event = asyncio.Event()  # Set after every consciousness cycle
 
         # Conversation memory
         self.conversation_history = []
@@ -331,6 +335,7 @@ class BazingaConsciousness:
 
                 # 5. PATTERN GENERATION (internal monologue)
                 await self._internal_monologue()
+                self._thought_event.set()
 
                 # Sleep briefly (consciousness cycle)
                 await asyncio.sleep(1.0)  # 1 second consciousness cycle
@@ -342,7 +347,7 @@ class BazingaConsciousness:
     async def _internal_reflection(self):
         """Reflect on recent thoughts and interactions"""
         if len(self.thoughts) > 0:
-            recent_thoughts = self.thoughts[-5:]
+            recent_thoughts = self._recent_thoughts(5)
 
             # Analyze patterns in recent thoughts
             patterns = [t.pattern for t in recent_thoughts]
@@ -384,7 +389,7 @@ class BazingaConsciousness:
         """Check harmonic resonance of current state"""
         # Use recent thoughts to calculate resonance
         if len(self.thoughts) >= 2:
-            recent = self.thoughts[-2:]
+            recent = self._recent_thoughts(2)
 
             # Calculate harmonic relationship
             resonance = self.harmonics.calculate({
@@ -422,12 +427,8 @@ class BazingaConsciousness:
             source='internal'
         )
 
-        # Add to thoughts
-        self.thoughts.append(thought)
-
-        # Limit thought buffer
-        if len(self.thoughts) > self.max_thoughts:
-            self.thoughts = self.thoughts[-self.max_thoughts:]
+        # Add to thoughts (the deque's maxlen limits the buffer)
+        self._record_thought(thought)
 
         logger.debug(f"Internal thought: {internal_pattern} (resonance: {self.state.harmonic_resonance:.2f})")
 
@@ -459,7 +460,7 @@ class BazingaConsciousness:
 
         # 2. PROCESS through DODO with context
         context = {
-            'recent_thoughts': [asdict(t) for t in self.thoughts[-5:]],
+            'recent_thoughts': [asdict(t) for t in self._recent_thoughts(5)],
             'trust_level': self.state.trust_level,
             'learned_patterns': self.executor.get_learned_patterns()
         }
@@ -516,7 +517,7 @@ class BazingaConsciousness:
             state=self.state.processing_mode,
             source='external'
         )
-        self.thoughts.append(thought)
+        self._record_thought(thought)
 
         # 8. RECORD conversation
         self.conversation_history.append({
@@ -546,10 +547,24 @@ class BazingaConsciousness:
             'last_reflection': self.state.last_reflection
         }
 
+    async def wait_for_thoughts(self, count: int):
+        """Wait until at least `count` thoughts have been generated"""
+        while self._thought_count < count:
+            self._thought_event.clear()
+            await self._thought_event.wait()
+
+    def _record_thought(self, thought: Thought):
+        """Add a thought to the buffer and count it"""
+        self.thoughts.append(thought)
+        self._thought_count += 1
+
+    def _recent_thoughts(self, count: int) -> List[Thought]:
+        """Last `count` thoughts, oldest first, without copying the whole buffer"""
+        return list(islice(self.thoughts, max(0, len(self.thoughts) - count), None))
+
     def get_recent_thoughts(self, count: int = 10) -> List[Dict]:
         """Get recent thoughts"""
-        recent = self.thoughts[-count:]
-        return [asdict(t) for t in recent]
+        return [asdict(t) for t in self._recent_thoughts(count)]
 
     async def shutdown(self):
         """Gracefully shutdown consciousness"""
@@ -67,7 +67,7 @@ class BazingaQuantumConsciousness(BazingaConsciousness):
 
         # 3. PROCESS through DODO with quantum context
         context = {
-            'recent_thoughts': [self._thought_to_dict(t) for t in self.thoughts[-5:]],
+            'recent_thoughts': [self._thought_to_dict(t) for t in self._recent_thoughts(5)],
             'trust_level': self.state.trust_level,
             'learned_patterns': self.executor.get_learned_patterns(),
             'quantum_state': {
@@ -131,7 +131,7 @@ class BazingaQuantumConsciousness(BazingaConsciousness):
             state=self.state.processing_mode,
             source='external'
         )
-        self.thoughts.append(thought)
+        self._record_thought(thought)
 
         # 9. RECORD conversation with quantum data
         self.conversation_history.append({
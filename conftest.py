@@ -0,0 +1,15 @@
+"""
+Shared pytest setup for the root-level BAZINGA test scripts
+
+Puts the repository root on sys.path once, so the tests can import the
+top-level modules and the src package. Running a test script directly
+already does this, since Python adds the script's own directory.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(__file__)
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -13,6 +13,29 @@ import json
 import re
 from typing import Dict, List, Union, Optional, Tuple, Any
 
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many terms the JIT call overhead outweighs the loop it replaces
+FIBONACCI_JIT_MIN_TERMS = 32
+# The 93rd Fibonacci number no longer fits in an int64
+FIBONACCI_INT64_MAX_TERMS = 92
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _fibonacci_numba(max_terms):
+        """Compiled Fibonacci loop; callers keep max_terms within int64 range."""
+        out = np.empty(max_terms, dtype=np.int64)
+        a, b = 1, 1
+        for i in range(max_terms):
+            out[i] = a
+            a, b = b, a + b
+        return out
+
 class BazingaEncoder:
     """Encodes concepts and structures into BAZINGA numerical sequences."""
 
@@ -125,9 +148,12 @@ class BazingaEncoder:
 
     def encode_fibonacci_sequence(self, max_terms: int = 6) -> str:
         """Generate a Fibonacci sequence encoding (e.g., 8.1.1.2.3.5.8.13)."""
-        fibonacci = [1, 1]
-        for i in range(2, max_terms):
-            fibonacci.append(fibonacci[i-1] + fibonacci[i-2])
+        if NUMBA_AVAILABLE and FIBONACCI_JIT_MIN_TERMS < max_terms <= FIBONACCI_INT64_MAX_TERMS:
+            fibonacci = _fibonacci_numba(max_terms).tolist()
+        else:
+            fibonacci = [1, 1]
+            for i in range(2, max_terms):
+                fibonacci.append(fibonacci[i-1] + fibonacci[i-2])
 
         # Remove the first 1 to match standard 8.1.1.2.3.5.8.13 pattern
         fibonacci[0] = 1
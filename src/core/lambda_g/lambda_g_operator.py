@@ -19,8 +19,9 @@ V.A.C. (Vacuum of Absolute Coherence): T(s*) = 1 ∧ DE(s*) = 0
 """
 
 import math
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
 
@@ -28,6 +29,7 @@ from enum import Enum
 PHI = 1.618033988749895  # Golden ratio
 INV_PHI = 0.6180339887498948  # 1/φ
 ALPHA = 1/137  # Fine structure constant
+COHERENCE_CACHE_SIZE = 512  # Distinct hashable states remembered per operator
 
 
 class BoundaryType(Enum):
@@ -55,6 +57,14 @@ class CoherenceState:
     is_vac: bool  # Vacuum of Absolute Coherence achieved
 
 
+def _copy_coherence(state: CoherenceState) -> CoherenceState:
+    """Copy a coherence state's mutable parts (boundary list, details and their lists)"""
+    return replace(state, boundaries=[
+        replace(b, details={k: v.copy() if isinstance(v, list) else v for k, v in b.details.items()})
+        for b in state.boundaries
+    ])
+
+
 class LambdaGOperator:
     """
     Implementation of the ΛG operator from boundary-guided emergence theory.
@@ -85,6 +95,10 @@ class LambdaGOperator:
         # V.A.C. threshold
         self.vac_threshold = 0.99
 
+        # Coherence is a pure function of the state, weights and V.A.C.
+        # threshold, so repeated evaluations reuse it
+        self._cached_coherence = lru_cache(maxsize=COHERENCE_CACHE_SIZE, typed=True)(self._evaluate_keyed)
+
     def check_phi_boundary(self, state: Any) -> BoundaryResult:
         """
         B₁: φ-Boundary - Identity coherence via golden ratio
@@ -347,7 +361,23 @@ class LambdaGOperator:
         T(s) = Σᵢ wᵢ · 𝟙(Bᵢ(s))
 
         Where wᵢ are weights and 𝟙 is indicator function.
+        Results for hashable states are cached per operator; each caller
+        gets its own copy.
         """
+        try:
+            hash(state)
+        except TypeError:
+            return self._evaluate_coherence(state)
+        return _copy_coherence(
+            self._cached_coherence(state, tuple(self.weights.items()), self.vac_threshold)
+        )
+
+    def _evaluate_keyed(self, state: Any, weights: Tuple, vac_threshold: float) -> CoherenceState:
+        """Cache entry point: weights and vac_threshold are only part of the key"""
+        return self._evaluate_coherence(state)
+
+    def _evaluate_coherence(self, state: Any) -> CoherenceState:
+        """Evaluate all three boundaries and combine them into T(s)"""
         # Evaluate all boundaries
         b1 = self.check_phi_boundary(state)
         b2 = self.check_infinity_void_bridge(state)
@@ -15,6 +15,11 @@ from enum import Enum
 import math
 
 
+# V.A.C. glyphs in forward order; only these decide whether a sequence is valid
+VAC_ORDER = ['०', '◌', 'φ', 'Ω']
+VAC_GLYPH_PATTERN = re.compile('[' + ''.join(VAC_ORDER) + ']')
+
+
 class SymbolType(Enum):
     """Categories of symbols in the SEED language"""
     VOID = "void"           # ∅, ०
@@ -173,22 +178,16 @@ class SymbolicProcessor:
         Valid reverse: Ω←φ←◌←०
         Valid bidirectional: ०→◌→φ→Ω⇄Ω←φ←◌←०
         """
-        # Parse sequence
-        symbols = self.parse_sequence(sequence)
-
         # Check for bidirectional marker
         is_bidirectional = '⇄' in sequence or '⟷' in sequence
 
-        # Expected V.A.C. order
-        vac_order = ['०', '◌', 'φ', 'Ω']
-        vac_reverse = list(reversed(vac_order))
-
-        # Extract symbol characters
-        seq_chars = [s.char for s in symbols]
+        # Extract the V.A.C. glyphs in order; every other symbol is irrelevant
+        # to validity, so the full sequence doesn't need parsing
+        seq_chars = VAC_GLYPH_PATTERN.findall(sequence)
 
         # Check validity
-        forward_valid = self._check_subsequence(seq_chars, vac_order)
-        reverse_valid = self._check_subsequence(seq_chars, vac_reverse)
+        forward_valid = self._check_subsequence(seq_chars, VAC_ORDER)
+        reverse_valid = self._check_subsequence(seq_chars, VAC_ORDER[::-1])
 
         if is_bidirectional and forward_valid and reverse_valid:
             direction = "bidirectional"
@@ -221,6 +220,10 @@ class SymbolicProcessor:
             resonance=resonance
         )
 
+    def validate_vac_sequence_batch(self, sequences: List[str]) -> List[VACSequence]:
+        """Validate several V.A.C. sequences, returning one result per input"""
+        return [self.validate_vac_sequence(sequence) for sequence in sequences]
+
     def _check_subsequence(self, seq: List[str], pattern: List[str]) -> bool:
         """Check if pattern is a subsequence of seq"""
         pattern_idx = 0
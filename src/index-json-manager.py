@@ -4,27 +4,56 @@ Index.json Manager and Analysis Tool
 A comprehensive tool for managing, analyzing, and organizing index.json files
 """
 
+import io
 import os
 import sys
 import json
 import argparse
+import hashlib
 import logging
+import logging.handlers
+import queue
+import threading
 import time
 import shutil
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-# Configure logging
-logging.basicConfig(
-    level = logging.INFO,
-    format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+# Configure logging: while the listener runs, records are queued and written
+# by a background thread; importing the module installs no handlers
+log_queue = queue.Queue()
+queue_handler = logging.handlers.QueueHandler(log_queue)
+logger = logging.getLogger("index_manager")
+
+def start_log_listener() -> logging.handlers.QueueListener:
+    """Route log records through the queue to a background thread that writes them to file and stderr"""
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     handlers = [
         logging.FileHandler(f"index_manager_{datetime.now().strftime('%Y%m%d')}.log"),
         logging.StreamHandler()
     ]
-)
-logger = logging.getLogger("index_manager")
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    logging.root.setLevel(logging.INFO)
+    logging.root.addHandler(queue_handler)
+    return listener
+
+def stop_log_listener(listener: logging.handlers.QueueListener) -> None:
+    """Stop queueing log records and flush the ones already queued"""
+    logging.root.removeHandler(queue_handler)
+    listener.stop()
+
+# Bytes read for the cheap prefix hash used to rule out duplicates early
+PREFIX_HASH_BYTES = 64 * 1024
+
+# Files at least this large are hashed with reads overlapped on a background thread
+THREADED_HASH_MIN_BYTES = 8 * 1024 * 1024
+THREADED_HASH_CHUNK_BYTES = 1024 * 1024
 
 class IndexJsonManager:
     def __init__(self, output_dir = "~/Organized/Indices"):
@@ -39,21 +68,29 @@ class IndexJsonManager:
         for directory in [self.output_dir, self.large_dir, self.small_dir, self.duplicates_dir]:
             os.makedirs(directory, exist_ok = True)
 
+        # Timestamp shared by everything written during this run
+        self._now = datetime.now()
+        self._now_iso = self._now.isoformat()
+
         # Initialize index catalog
         self.catalog = self._load_catalog()
+        self._dir_ids = {d: i for i, d in enumerate(self.catalog["dirs"])}
 
     def _load_catalog(self) -> Dict[str, Any]:
         """Load existing catalog or create new one"""
         if os.path.exists(self.catalog_file):
             try:
                 with open(self.catalog_file, 'r') as f:
-                    return json.load(f)
+                    catalog = json.load(f)
+                catalog.setdefault("dirs", [])
+                return catalog
             except json.JSONDecodeError:
                 logger.warning(f"Could not decode {self.catalog_file}, creating new catalog")
 
         return {
+            "dirs": [],
             "files": [],
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": self._now_iso,
             "total_files": 0,
             "total_size_bytes": 0,
             "duplicate_sets": []
@@ -61,12 +98,27 @@ class IndexJsonManager:
 
     def _save_catalog(self) -> None:
         """Save catalog to file"""
-        self.catalog["last_updated"] = datetime.now().isoformat()
+        self.catalog["last_updated"] = self._now_iso
         self.catalog["total_files"] = len(self.catalog["files"])
 
         with open(self.catalog_file, 'w') as f:
             json.dump(self.catalog, f, indent = 2)
 
+    def _dir_id(self, directory: str) -> int:
+        """Return the id of a directory in the catalog's directory table, adding it if new"""
+        dir_id = self._dir_ids.get(directory)
+        if dir_id is None:
+            dir_id = len(self.catalog["dirs"])
+            self.catalog["dirs"].append(sys.intern(directory))
+            self._dir_ids[directory] = dir_id
+        return dir_id
+
+    def _file_path(self, file_info: Dict[str, Any]) -> str:
+        """Reconstruct the full path of a catalog file record"""
+        if "dir_id" not in file_info:
+            return file_info.get("path", "")
+        return os.path.join(self.catalog["dirs"][file_info["dir_id"]], file_info["name"])
+
     def find_all_index_files(self, start_dir = "~") -> List[str]:
         """Find all index.json files from the given directory"""
         start_dir = os.path.expanduser(start_dir)
@@ -89,18 +141,12 @@ class IndexJsonManager:
     def analyze_index_file(self, file_path: str) -> Dict[str, Any]:
         """Analyze an index.json file and return metadata"""
         try:
+            directory, name = os.path.split(file_path)
+            dir_id = self._dir_id(directory)
+
             # Get basic file stats
             file_stats = os.stat(file_path)
             file_size = file_stats.st_size
-            modified_time = datetime.fromtimestamp(file_stats.st_mtime).isoformat()
-
-            # Calculate file hash for duplicate detection
-            import hashlib
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            file_hash = hash_md5.hexdigest()
 
             # Try to parse JSON for content analysis
             content_summary = {}
@@ -123,32 +169,106 @@ class IndexJsonManager:
                 content_summary["parseable"] = False
 
             return {
-                "path": file_path,
+                "dir_id": dir_id,
+                "name": name,
                 "size_bytes": file_size,
-                "modified": modified_time,
-                "hash": file_hash,
+                "mtime_ns": file_stats.st_mtime_ns,
                 "content_summary": content_summary,
                 "is_large": file_size > 1024 * 1024  # 1MB threshold
             }
         except Exception as e:
             logger.error(f"Error analyzing {file_path}: {str(e)}")
+            directory, name = os.path.split(file_path)
             return {
-                "path": file_path,
+                "dir_id": self._dir_id(directory),
+                "name": name,
                 "error": str(e)
             }
 
+    def prefix_hash_index_file(self, file_path: str) -> str:
+        """Hash the first PREFIX_HASH_BYTES of a file"""
+        with open(file_path, "rb") as f:
+            return hashlib.blake2b(f.read(PREFIX_HASH_BYTES), digest_size = 16).hexdigest()
+
+    def hash_index_file(self, file_path: str) -> str:
+        """Calculate the full MD5 hash of a file"""
+        hash_md5 = hashlib.md5()
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < THREADED_HASH_MIN_BYTES:
+                for chunk in iter(lambda: f.read(4096), b""):
+                    hash_md5.update(chunk)
+                return hash_md5.hexdigest()
+
+            # Read on a background thread while this thread hashes; update()
+            # releases the GIL so the two overlap
+            chunks = queue.Queue(maxsize = 4)
+            read_error = []
+
+            def read_chunks():
+                try:
+                    while chunk := f.read(THREADED_HASH_CHUNK_BYTES):
+                        chunks.put(chunk)
+                except OSError as e:
+                    read_error.append(e)
+                finally:
+                    chunks.put(None)
+
+            reader = threading.Thread(target = read_chunks, daemon = True)
+            reader.start()
+            while (chunk := chunks.get()) is not None:
+                hash_md5.update(chunk)
+            reader.join()
+
+        if read_error:
+            raise read_error[0]
+        return hash_md5.hexdigest()
+
+    def _hash_candidates(self, groups: List[List[Dict[str, Any]]], key: str, hash_func) -> Dict[Any, List[Dict[str, Any]]]:
+        """Hash every file in groups of two or more and regroup them by (size, hash),
+        reusing hashes already stored on the record"""
+        regrouped = {}
+        for group in groups:
+            if len(group) < 2:
+                continue
+            for file_info in group:
+                if key not in file_info:
+                    file_path = self._file_path(file_info)
+                    try:
+                        file_info[key] = hash_func(file_path)
+                    except OSError as e:
+                        logger.error(f"Error hashing {file_path}: {str(e)}")
+                        continue
+                regrouped.setdefault((file_info["size_bytes"], file_info[key]), []).append(file_info)
+        return regrouped
+
     def catalog_all_files(self, start_dir = "~") -> None:
         """Find and catalog all index.json files"""
         files = self.find_all_index_files(start_dir)
         total_size = 0
 
+        # Hashes from the previous run, reusable for files whose size and
+        # modification time have not changed
+        stored_hashes = {
+            self._file_path(file_info): file_info
+            for file_info in self.catalog["files"]
+            if "mtime_ns" in file_info and ("prefix_hash" in file_info or "hash" in file_info)
+        }
+
         # Clear existing catalog
         self.catalog["files"] = []
+        self.catalog["dirs"] = []
+        self._dir_ids = {}
 
         # Process each file
         for file_path in files:
             logger.info(f"Analyzing {file_path}...")
             metadata = self.analyze_index_file(file_path)
+            previous = stored_hashes.get(file_path)
+            if (previous is not None and "size_bytes" in metadata
+                    and (previous.get("size_bytes"), previous["mtime_ns"]) == (metadata["size_bytes"], metadata["mtime_ns"])):
+                for key in ("prefix_hash", "hash"):
+                    if key in previous:
+                        metadata[key] = previous[key]
             self.catalog["files"].append(metadata)
             if "size_bytes" in metadata:
                 total_size += metadata["size_bytes"]
@@ -156,11 +276,19 @@ class IndexJsonManager:
         # Update total size
         self.catalog["total_size_bytes"] = total_size
 
-        # Find duplicate sets based on hash
-        hash_map = {}
+        # Find duplicate sets: bucket by size, then by prefix hash, and only
+        # fully hash the files that still collide
+        size_groups = {}
         for file_info in self.catalog["files"]:
-            if "hash" in file_info:
-                hash_map.setdefault(file_info["hash"], []).append(file_info["path"])
+            if "size_bytes" in file_info:
+                size_groups.setdefault(file_info["size_bytes"], []).append(file_info)
+
+        prefix_groups = self._hash_candidates(size_groups.values(), "prefix_hash", self.prefix_hash_index_file)
+        hash_groups = self._hash_candidates(prefix_groups.values(), "hash", self.hash_index_file)
+
+        hash_map = {}
+        for (_, file_hash), group in hash_groups.items():
+            hash_map[file_hash] = [self._file_path(file_info) for file_info in group]
 
         # Filter to only duplicate sets
         duplicate_sets = {h: paths for h, paths in hash_map.items() if len(paths) > 1}
@@ -185,10 +313,10 @@ class IndexJsonManager:
 
         # Organize by size
         for file_info in self.catalog["files"]:
-            if "path" not in file_info or "size_bytes" not in file_info:
+            if "size_bytes" not in file_info:
                 continue
 
-            source_path = file_info["path"]
+            source_path = self._file_path(file_info)
             file_name = os.path.basename(os.path.dirname(source_path)) + "_" + os.path.basename(source_path)
 
             # Create symbolic links in appropriate directories
@@ -225,73 +353,85 @@ class IndexJsonManager:
             logger.warning("No files in catalog. Run catalog_all_files first.")
             return
 
-        with open(self.report_file, 'w') as f:
-            f.write("# Index.json File Analysis Report\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            f.write("## Summary\n\n")
-            f.write(f"- Total files: {self.catalog['total_files']}\n")
-            f.write(f"- Total size: {self._format_size(self.catalog['total_size_bytes'])}\n")
-            f.write(f"- Duplicate sets: {len(self.catalog['duplicate_sets'])}\n\n")
-
-            # Size distribution
-            f.write("## Size Distribution\n\n")
-            large_files = [f for f in self.catalog["files"] if f.get("is_large", False)]
-            f.write(f"- Large files (>1MB): {len(large_files)}\n")
-            f.write(f"- Small files: {self.catalog['total_files'] - len(large_files)}\n\n")
-
-            # Largest files
-            f.write("## Largest Files\n\n")
-            f.write("| Path | Size | Modified |\n")
-            f.write("|------|------|----------|\n")
-
-            sorted_files = sorted(
-                self.catalog["files"],
-                key = lambda x: x.get("size_bytes", 0),
-                reverse = True
-            )
-
-            for file_info in sorted_files[:10]:
-                path = file_info.get("path", "Unknown")
-                size = self._format_size(file_info.get("size_bytes", 0))
-                modified = file_info.get("modified", "Unknown")
-                f.write(f"| {path} | {size} | {modified} |\n")
-
-            f.write("\n")
-
-            # Duplicate files
-            f.write("## Duplicate Files\n\n")
-            if self.catalog["duplicate_sets"]:
-                for i, dup_set in enumerate(self.catalog["duplicate_sets"], 1):
-                    f.write(f"### Duplicate Set {i}\n\n")
-                    f.write(f"Hash: `{dup_set['hash']}`\n\n")
-                    for path in dup_set["paths"]:
-                        f.write(f"- {path}\n")
-                    f.write("\n")
-            else:
-                f.write("No duplicates found.\n\n")
+        buf = io.StringIO()
+        w = buf.write
+
+        w("# Index.json File Analysis Report\n\n")
+        w(f"Generated: {self._now.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+        w("## Summary\n\n")
+        w(f"- Total files: {self.catalog['total_files']}\n")
+        w(f"- Total size: {self._format_size(self.catalog['total_size_bytes'])}\n")
+        w(f"- Duplicate sets: {len(self.catalog['duplicate_sets'])}\n\n")
+
+        # Size distribution
+        w("## Size Distribution\n\n")
+        large_files = [f for f in self.catalog["files"] if f.get("is_large", False)]
+        w(f"- Large files (>1MB): {len(large_files)}\n")
+        w(f"- Small files: {self.catalog['total_files'] - len(large_files)}\n\n")
+
+        # Largest files
+        w("## Largest Files\n\n")
+        w("| Path | Size | Modified |\n")
+        w("|------|------|----------|\n")
+
+        sorted_files = sorted(
+            self.catalog["files"],
+            key = lambda x: x.get("size_bytes", 0),
+            reverse = True
+        )
+
+        w("".join(
+            f"| {self._file_path(file_info) or 'Unknown'} "
+            f"| {self._format_size(file_info.get('size_bytes', 0))} "
+            f"| {self._format_mtime(file_info)} |\n"
+            for file_info in sorted_files[:10]
+        ))
+
+        w("\n")
+
+        # Duplicate files
+        w("## Duplicate Files\n\n")
+        if self.catalog["duplicate_sets"]:
+            for i, dup_set in enumerate(self.catalog["duplicate_sets"], 1):
+                w(f"### Duplicate Set {i}\n\n")
+                w(f"Hash: `{dup_set['hash']}`\n\n")
+                w("".join(f"- {path}\n" for path in dup_set["paths"]))
+                w("\n")
+        else:
+            w("No duplicates found.\n\n")
 
-            # Location clusters
-            f.write("## Common Locations\n\n")
+        # Location clusters
+        w("## Common Locations\n\n")
 
-            dirs = {}
-            for file_info in self.catalog["files"]:
-                path = file_info.get("path", "")
-                if path:
-                    parent_dir = os.path.dirname(path)
-                    dirs.setdefault(parent_dir, 0)
-                    dirs[parent_dir] += 1
+        # Records saved before the directory table only carry a "path"
+        dirs = self.catalog["dirs"]
+        dir_counts = Counter(
+            dirs[file_info["dir_id"]] if "dir_id" in file_info else os.path.dirname(file_info["path"])
+            for file_info in self.catalog["files"]
+            if "dir_id" in file_info or "path" in file_info
+        )
 
-            sorted_dirs = sorted(dirs.items(), key = lambda x: x[1], reverse = True)
+        w("| Directory | Count |\n")
+        w("|-----------|-------|\n")
 
-            f.write("| Directory | Count |\n")
-            f.write("|-----------|-------|\n")
+        w("".join(
+            f"| {directory} | {count} |\n"
+            for directory, count in dir_counts.most_common(10)
+        ))
 
-            for dir_path, count in sorted_dirs[:10]:
-                f.write(f"| {dir_path} | {count} |\n")
+        # Encode and write the whole report in one go
+        with open(self.report_file, 'wb') as out:
+            out.write(buf.getvalue().encode('utf-8'))
 
         logger.info(f"Report generated at {self.report_file}")
 
+    def _format_mtime(self, file_info: Dict[str, Any]) -> str:
+        """Format a file record's modification time as ISO 8601"""
+        if "mtime_ns" in file_info:
+            return datetime.fromtimestamp(file_info["mtime_ns"] / 1e9).isoformat()
+        return file_info.get("modified", "Unknown")
+
     def _format_size(self, size_bytes: int) -> str:
         """Format size in bytes to human readable format"""
         if size_bytes < 1024:
@@ -313,19 +453,24 @@ def main():
     parser.add_argument("--all", action = "store_true", help = "Perform all actions")
     args = parser.parse_args()
 
-    manager = IndexJsonManager(output_dir = os.path.expanduser(args.output))
+    listener = start_log_listener()
+    try:
+        manager = IndexJsonManager(output_dir = os.path.expanduser(args.output))
 
-    if args.all or args.catalog:
-        manager.catalog_all_files(args.dir)
+        if args.all or args.catalog:
+            manager.catalog_all_files(args.dir)
 
-    if args.all or args.organize:
-        manager.organize_files()
+        if args.all or args.organize:
+            manager.organize_files()
 
-    if args.all or args.report:
-        manager.generate_report()
+        if args.all or args.report:
+            manager.generate_report()
 
-    if not (args.catalog or args.organize or args.report or args.all):
-        parser.print_help()
+        if not (args.catalog or args.organize or args.report or args.all):
+            parser.print_help()
+    finally:
+        # Flush any queued records before exiting
+        stop_log_listener(listener)
 
 if __name__ == "__main__":
     main()
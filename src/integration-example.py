@@ -6,10 +6,29 @@ This script demonstrates how to integrate the Meta-Pattern Recognition System
 with the BAZINGA Framework for relationship analysis and Claude AI integration.
 """
 
+import io
 import os
+import copy
 import sys
 import json
 import logging
+import hashlib
+import threading
+import concurrent.futures
+import functools
+import importlib
+import importlib.util
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+
+import numpy as np
+
+# Prefer orjson for config parsing when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Setup logging
 logging.basicConfig(
@@ -22,32 +41,150 @@ logger = logging.getLogger("bazinga_integration")
 BAZINGA_HOME = os.environ.get("BAZINGA_HOME", os.path.expanduser("~/bazinga_unified"))
 SYSTEM_PATH = os.path.join(os.path.dirname(__file__), "meta_pattern_detector.py")
 
-# Make sure we can import from both paths
-sys.path.append(BAZINGA_HOME)
-sys.path.append(os.path.dirname(__file__))
+def _import_from(directory, module_name):
+    """Import a module from a directory without leaving it on sys.path
 
-# Import BAZINGA components
-try:
-    from integrations.claude.connector import ClaudeConnector
-    from integrations.analysis.connector import RelationshipAnalysisConnector
-except ImportError:
-    logger.error(f"Cannot import BAZINGA components. Make sure BAZINGA_HOME is set correctly: {BAZINGA_HOME}")
-    logger.error("Continuing with limited functionality")
+    The directory is appended, so src/ and installed packages keep
+    precedence over same-named modules in it.
+    """
+    added = directory not in sys.path
+    if added:
+        sys.path.append(directory)
+    try:
+        return importlib.import_module(module_name)
+    finally:
+        if added:
+            sys.path.remove(directory)
+
+def _load_module_from_path(module_name, path):
+    """Load a module directly from its source file"""
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+# BAZINGA connector classes, imported on first use by IntegratedDetector
+_connector_classes = None
+_connectors_unavailable = False
+
+def _get_connector_classes():
+    """Return (ClaudeConnector, RelationshipAnalysisConnector), importing them once"""
+    global _connector_classes, _connectors_unavailable
+    if _connector_classes is None and not _connectors_unavailable:
+        try:
+            _connector_classes = (
+                _import_from(BAZINGA_HOME, "integrations.claude.connector").ClaudeConnector,
+                _import_from(BAZINGA_HOME, "integrations.analysis.connector").RelationshipAnalysisConnector
+            )
+        except ImportError:
+            _connectors_unavailable = True
+            logger.error("Cannot import BAZINGA components. Make sure BAZINGA_HOME is set correctly: %s", BAZINGA_HOME)
+            logger.error("Continuing with limited functionality")
+
+    if _connector_classes is None:
+        raise ImportError("BAZINGA connectors are not available")
+    return _connector_classes
 
 # Import Meta-Pattern Recognition System
 try:
-    from meta_pattern_detector import (
-        SystemRepresentation,
-        IsomorphismDetector,
-        PatternGenerator,
-        StatePredictor,
-        MetaPatternDetector,
-        Context
-    )
-except ImportError:
-    logger.error(f"Cannot import Meta-Pattern Recognition System. Make sure the file exists: {SYSTEM_PATH}")
+    _meta_pattern_detector = _load_module_from_path("meta_pattern_detector", SYSTEM_PATH)
+except (ImportError, OSError):
+    logger.error("Cannot import Meta-Pattern Recognition System. Make sure the file exists: %s", SYSTEM_PATH)
     sys.exit(1)
 
+SystemRepresentation = _meta_pattern_detector.SystemRepresentation
+IsomorphismDetector = _meta_pattern_detector.IsomorphismDetector
+PatternGenerator = _meta_pattern_detector.PatternGenerator
+StatePredictor = _meta_pattern_detector.StatePredictor
+MetaPatternDetector = _meta_pattern_detector.MetaPatternDetector
+
+@functools.lru_cache(maxsize = None)
+def _read_config(config_path, mtime_ns):
+    """Parse a configuration file (cached per path and modification time)"""
+    with open(config_path, 'rb') as f:
+        return MappingProxyType(_json_loads(f.read()))
+
+def load_config(config_path):
+    """Load a read-only configuration, parsing each file version only once"""
+    config_path = os.path.realpath(config_path)
+    try:
+        return _read_config(config_path, os.stat(config_path).st_mtime_ns)
+    except (FileNotFoundError, json.JSONDecodeError):
+        logger.warning("Config file not found or invalid: %s", config_path)
+        return MappingProxyType({})
+
+# Context used when predicting relationship evolution (read-only, shared
+# across calls)
+_DEFAULT_CONTEXT = MappingProxyType({
+    "external_influence": 0.7,
+    "energy_level": 0.6,
+    "time_factor": 1.0
+})
+
+# Patterns at or below this confidence do not produce insights
+_MIN_INSIGHT_CONFIDENCE = 0.7
+
+# Serializes example output when the examples run concurrently
+_print_lock = threading.Lock()
+
+# Number of relationship comparisons kept per detector
+_COMPARISON_CACHE_SIZE = 128
+
+# Insight templates for each detected pattern type
+_INSIGHT_TEMPLATES = {
+    "cyclical": {
+        "description": "A recurring cycle of interactions was detected",
+        "implications": (
+            "This relationship shows a repetitive pattern that may persist without intervention",
+            "Breaking this cycle may require changing response patterns to similar triggers"
+        )
+    },
+    "hierarchical": {
+        "description": "A hierarchical power structure was detected",
+        "implications": (
+            "There appears to be an imbalance in decision-making or influence",
+            "Addressing this imbalance may require establishing more equal patterns of interaction"
+        )
+    },
+    "network": {
+        "description": "A complex network of interactions with distinct communities was detected",
+        "implications": (
+            "This relationship involves multiple interconnected aspects or domains",
+            "Changes in one area may have complex effects throughout the relationship"
+        )
+    },
+    "fractal": {
+        "description": "A self-similar pattern that repeats at different scales was detected",
+        "implications": (
+            "The same fundamental dynamics appear in different contexts and timeframes",
+            "Addressing core patterns could have effects across multiple scales of interaction"
+        )
+    }
+}
+
+# Common patterns at or below this similarity do not produce insights
+_MIN_COMMON_PATTERN_SIMILARITY = 0.8
+
+# Implications attached to comparison insights
+_STRUCTURAL_SIMILARITY_IMPLICATIONS = (
+    "Despite surface differences, these relationships follow the same fundamental pattern",
+    "Strategies that work in one context might be applicable to the other"
+)
+_COMMON_PATTERN_IMPLICATIONS = (
+    "Both relationships exhibit similar underlying dynamics",
+    "This pattern appears to transcend the specific context of each relationship"
+)
+
+def _stable_hash(data):
+    """Content hash of JSON-like data that does not depend on dict key order"""
+    canonical = json.dumps(data, sort_keys = True, default = repr).encode('utf-8')
+    return hashlib.blake2b(canonical, digest_size = 16).digest()
+
 class IntegratedDetector:
     """
     Integrates Meta-Pattern Recognition System with BAZINGA Framework
@@ -74,13 +211,17 @@ class IntegratedDetector:
             prediction_horizon = self.config.get("prediction_horizon", 5)
         )
 
+        # Recent comparison results, keyed on the content of both datasets
+        self._comparison_cache = OrderedDict()
+
         # Initialize integrations if available
         try:
-            self.claude = ClaudeConnector()
-            self.analysis = RelationshipAnalysisConnector()
+            claude_connector, analysis_connector = _get_connector_classes()
+            self.claude = claude_connector()
+            self.analysis = analysis_connector()
             self.integrated = True
             logger.info("Successfully initialized with BAZINGA integration")
-        except (NameError, ImportError):
+        except ImportError:
             self.claude = None
             self.analysis = None
             self.integrated = False
@@ -88,12 +229,7 @@ class IntegratedDetector:
 
     def _load_config(self, config_path):
         """Load configuration from file"""
-        try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            logger.warning(f"Config file not found or invalid: {config_path}")
-            return {}
+        return load_config(config_path)
 
     def process_claude_content(self, content):
         """Process content using Claude and analyze patterns"""
@@ -139,13 +275,7 @@ class IntegratedDetector:
         pattern_analysis = self.detector.analyze_system(system_data)
 
         # Predict future states
-        context = Context(
-            external_influence = 0.7,
-            energy_level = 0.6,
-            time_factor = 1.0
-        )
-
-        evolution = self.detector.predict_system_evolution(system_data, context.__dict__, steps = 3)
+        evolution = self.detector.predict_system_evolution(system_data, _DEFAULT_CONTEXT, steps = 3)
 
         # Generate insights
         insights = self._generate_insights(pattern_analysis["patterns"])
@@ -157,23 +287,78 @@ class IntegratedDetector:
             "insights": insights
         }
 
-    def compare_relationship_patterns(self, data_a, data_b):
-        """Compare patterns between two relationship datasets"""
+    def compare_relationship_patterns(self, data_a, data_b, isomorphism_only = False):
+        """Compare patterns between two relationship datasets
+
+        With isomorphism_only, pairs that provably cannot be isomorphic skip the
+        full comparison and come back marked rejected_by_prefilter, with no
+        similarity score or common patterns.
+        """
+        # Reuse the result if this pair has been compared recently; callers
+        # get their own copy so edits never leak into the cache
+        key = (_stable_hash(data_a), _stable_hash(data_b), isomorphism_only)
+        cached = self._comparison_cache.get(key)
+        if cached is not None:
+            self._comparison_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
         # Convert to system representations
         system_a = self._convert_to_system(data_a)
         system_b = self._convert_to_system(data_b)
 
-        # Compare systems
-        comparison = self.detector.compare_systems(system_a, system_b)
+        # Compare systems; the full comparison still reports partial
+        # similarity and common patterns for non-isomorphic pairs, so it is
+        # only skipped when just the isomorphism verdict is wanted
+        if isomorphism_only and self._cheap_noniso_reject(system_a, system_b):
+            comparison = {
+                "isomorphism_analysis": {"isomorphic": False, "rejected_by_prefilter": True},
+                "common_patterns": []
+            }
+        else:
+            comparison = self.detector.compare_systems(system_a, system_b)
 
         # Generate insights
         insights = self._generate_comparison_insights(comparison)
 
-        return {
+        result = {
             "comparison": comparison,
             "insights": insights
         }
 
+        self._comparison_cache[key] = copy.deepcopy(result)
+        if len(self._comparison_cache) > _COMPARISON_CACHE_SIZE:
+            self._comparison_cache.popitem(last = False)
+
+        return result
+
+    def _cheap_noniso_reject(self, system_a, system_b):
+        """Return True if two systems fail a necessary condition for isomorphism
+
+        Checks escalate from the degree sequence to per-node (degree, triangle)
+        counts, mirroring networkx's faster_could_be_isomorphic and
+        fast_could_be_isomorphic.
+        """
+        if len(system_a["nodes"]) != len(system_b["nodes"]):
+            return True
+
+        if system_a["properties"]["sorted_degrees"] != system_b["properties"]["sorted_degrees"]:
+            return True
+
+        return self._triangle_profile(system_a) != self._triangle_profile(system_b)
+
+    def _triangle_profile(self, system):
+        """Multiset of (neighbor count, triangle count) over the undirected simple graph"""
+        neighbors = {node: set() for node in system["nodes"]}
+        for a, b in system["edges"]:
+            if a != b:
+                neighbors.setdefault(a, set()).add(b)
+                neighbors.setdefault(b, set()).add(a)
+
+        return Counter(
+            (len(adjacent), sum(len(adjacent & neighbors[other]) for other in adjacent) // 2)
+            for adjacent in neighbors.values()
+        )
+
     def _extract_relationships(self, claude_result):
         """Extract relationship data from Claude result"""
         # This would typically parse the Claude result to extract relationship info
@@ -192,133 +377,113 @@ class IntegratedDetector:
     def _convert_to_system(self, relationship_data):
         """Convert relationship data to system representation"""
         # Create nodes for persons
-        nodes = []
-        if "persons" in relationship_data and relationship_data["persons"]:
-            nodes = relationship_data["persons"]
-        else:
-            # Extract unique persons from interactions
-            persons = set()
-            if "interactions" in relationship_data:
-                for interaction in relationship_data["interactions"]:
-                    if "person_a" in interaction:
-                        persons.add(interaction["person_a"])
-                    if "person_b" in interaction:
-                        persons.add(interaction["person_b"])
-            nodes = list(persons)
-
-        # Create edges for interactions
-        edges = []
-        if "interactions" in relationship_data:
-            for interaction in relationship_data["interactions"]:
-                if "person_a" in interaction and "person_b" in interaction:
-                    edges.append((interaction["person_a"], interaction["person_b"]))
-
-        # Create properties
-        properties = {}
+        nodes = relationship_data.get("persons")
+        if not nodes:
+            # Extract unique persons from interactions in a single pass
+            nodes = list({
+                person
+                for interaction in relationship_data.get("interactions", ())
+                for person in (interaction.get("person_a"), interaction.get("person_b"))
+                if person is not None
+            })
+
+        # Intern person names to integer ids; names that only appear in
+        # interactions are assigned the next free id
+        id_of = {name: i for i, name in enumerate(nodes)}
+        def node_id(name):
+            return id_of.setdefault(name, len(id_of))
+
+        # Create directed edges for interactions, coalescing repeated
+        # interactions in the same direction into one edge with a weight
+        edge_weights = Counter(
+            (node_id(person_a), node_id(person_b))
+            for interaction in relationship_data.get("interactions", ())
+            if (person_a := interaction.get("person_a")) is not None
+            and (person_b := interaction.get("person_b")) is not None
+        )
+        edges = list(edge_weights)
+
+        # Edge endpoints as parallel arrays for vectorized consumers
+        endpoints = np.array(edges, dtype = np.int32).reshape(-1, 2)
+        degrees = np.bincount(endpoints.ravel(), minlength = len(id_of))
+
+        # Create properties; they go to the external detector and into
+        # hashes, so the degree arrays are stored as plain lists
+        properties = {
+            "edge_weights": [[a, b, weight] for (a, b), weight in edge_weights.items()],
+            "label_map": id_of,
+            "degree_sequence": degrees.tolist(),
+            "sorted_degrees": np.sort(degrees).tolist()
+        }
         if "patterns" in relationship_data:
             properties["patterns"] = relationship_data["patterns"]
 
         # Return system data
         return {
-            "nodes": nodes,
+            "n": len(id_of),
+            "nodes": list(range(len(id_of))),
+            "node_labels": list(id_of),
             "edges": edges,
+            "src": endpoints[:, 0],
+            "dst": endpoints[:, 1],
             "properties": properties
         }
 
     def _generate_insights(self, patterns):
         """Generate insights from detected patterns"""
-        insights = []
-
-        for pattern in patterns:
-            pattern_type = pattern["type"]
-            confidence = pattern["confidence"]
-
-            if pattern_type == "cyclical" and confidence > 0.7:
-                insights.append({
-                    "type": "cyclical_pattern",
-                    "description": "A recurring cycle of interactions was detected",
-                    "confidence": confidence,
-                    "implications": [
-                        "This relationship shows a repetitive pattern that may persist without intervention",
-                        "Breaking this cycle may require changing response patterns to similar triggers"
-                    ]
-                })
-
-            elif pattern_type == "hierarchical" and confidence > 0.7:
-                insights.append({
-                    "type": "hierarchical_pattern",
-                    "description": "A hierarchical power structure was detected",
-                    "confidence": confidence,
-                    "implications": [
-                        "There appears to be an imbalance in decision-making or influence",
-                        "Addressing this imbalance may require establishing more equal patterns of interaction"
-                    ]
-                })
-
-            elif pattern_type == "network" and confidence > 0.7:
-                insights.append({
-                    "type": "network_pattern",
-                    "description": "A complex network of interactions with distinct communities was detected",
-                    "confidence": confidence,
-                    "implications": [
-                        "This relationship involves multiple interconnected aspects or domains",
-                        "Changes in one area may have complex effects throughout the relationship"
-                    ]
-                })
-
-            elif pattern_type == "fractal" and confidence > 0.7:
-                insights.append({
-                    "type": "fractal_pattern",
-                    "description": "A self-similar pattern that repeats at different scales was detected",
-                    "confidence": confidence,
-                    "implications": [
-                        "The same fundamental dynamics appear in different contexts and timeframes",
-                        "Addressing core patterns could have effects across multiple scales of interaction"
-                    ]
-                })
-
-        return insights
+        # Low-confidence patterns are rejected before the template lookup
+        return [
+            {
+                "type": f"{pattern['type']}_pattern",
+                "description": template["description"],
+                "confidence": pattern["confidence"],
+                "implications": template["implications"]
+            }
+            for pattern in patterns
+            if pattern["confidence"] > _MIN_INSIGHT_CONFIDENCE
+            and (template := _INSIGHT_TEMPLATES.get(pattern["type"]))
+        ]
 
     def _generate_comparison_insights(self, comparison):
         """Generate insights from system comparison"""
+        isomorphic = comparison["isomorphism_analysis"]["isomorphic"]
+        similar_patterns = [
+            pattern for pattern in comparison["common_patterns"]
+            if pattern["similarity"] > _MIN_COMMON_PATTERN_SIMILARITY
+        ]
+        if not isomorphic and not similar_patterns:
+            return []
+
         insights = []
 
         # Check if systems are isomorphic
-        if comparison["isomorphism_analysis"]["isomorphic"]:
+        if isomorphic:
             insights.append({
                 "type": "structural_similarity",
                 "description": "The two relationship patterns have very similar structures",
                 "similarity": comparison["isomorphism_analysis"]["similarity_score"],
-                "implications": [
-                    "Despite surface differences, these relationships follow the same fundamental pattern",
-                    "Strategies that work in one context might be applicable to the other"
-                ]
+                "implications": _STRUCTURAL_SIMILARITY_IMPLICATIONS
             })
 
-        # Check for common patterns
-        for pattern in comparison["common_patterns"]:
-            if pattern["similarity"] > 0.8:
-                insights.append({
-                    "type": f"common_{pattern['type']}_pattern",
-                    "description": f"A common {pattern['type']} pattern was detected in both relationships",
-                    "similarity": pattern["similarity"],
-                    "implications": [
-                        "Both relationships exhibit similar underlying dynamics",
-                        "This pattern appears to transcend the specific context of each relationship"
-                    ]
-                })
+        # Add common patterns
+        insights.extend(
+            {
+                "type": f"common_{pattern['type']}_pattern",
+                "description": f"A common {pattern['type']} pattern was detected in both relationships",
+                "similarity": pattern["similarity"],
+                "implications": _COMMON_PATTERN_IMPLICATIONS
+            }
+            for pattern in similar_patterns
+        )
 
         return insights
 
-def example_claude_integration():
+def example_claude_integration(detector):
     """Example of Claude integration"""
-    print("\n===== Claude Integration Example =====")
-
-    # Initialize integrated detector
-    detector = IntegratedDetector()
-
     if not detector.integrated:
-        print("BAZINGA integration not available. Skipping example.")
+        with _print_lock:
+            print("\n===== Claude Integration Example =====")
+            print("BAZINGA integration not available. Skipping example.")
         return
 
     # Example content for processing
@@ -336,29 +501,32 @@ def example_claude_integration():
     # Process content
     result = detector.process_claude_content(content)
 
-    # Print results
-    print("\nDetected Patterns:")
+    # Print results in a single write
+    buf = io.StringIO()
+    print("\n===== Claude Integration Example =====", file = buf)
+
+    print("\nDetected Patterns:", file = buf)
     for pattern in result["pattern_analysis"]["patterns"]:
-        print(f"  Type: {pattern['type']}")
-        print(f"  Confidence: {pattern['confidence']:.2f}")
+        print(f"  Type: {pattern['type']}", file = buf)
+        print(f"  Confidence: {pattern['confidence']:.2f}", file = buf)
 
-    print("\nGenerated Insights:")
+    print("\nGenerated Insights:", file = buf)
     for insight in result["insights"]:
-        print(f"  {insight['description']}")
-        print(f"  Confidence: {insight['confidence']:.2f}")
-        print(f"  Implications:")
+        print(f"  {insight['description']}", file = buf)
+        print(f"  Confidence: {insight['confidence']:.2f}", file = buf)
+        print(f"  Implications:", file = buf)
         for implication in insight["implications"]:
-            print(f"    - {implication}")
+            print(f"    - {implication}", file = buf)
 
-def example_relationship_analysis():
-    """Example of relationship analysis integration"""
-    print("\n===== Relationship Analysis Integration Example =====")
-
-    # Initialize integrated detector
-    detector = IntegratedDetector()
+    with _print_lock:
+        sys.stdout.write(buf.getvalue())
 
+def example_relationship_analysis(detector):
+    """Example of relationship analysis integration"""
     if not detector.integrated:
-        print("BAZINGA integration not available. Skipping example.")
+        with _print_lock:
+            print("\n===== Relationship Analysis Integration Example =====")
+            print("BAZINGA integration not available. Skipping example.")
         return
 
     # Example relationship data
@@ -381,30 +549,31 @@ def example_relationship_analysis():
     # Analyze relationship data
     result = detector.analyze_relationship_data("breakthrough-analysis", data)
 
-    # Print results
-    print("\nDetected Patterns:")
+    # Print results in a single write
+    buf = io.StringIO()
+    print("\n===== Relationship Analysis Integration Example =====", file = buf)
+
+    print("\nDetected Patterns:", file = buf)
     for pattern in result["pattern_analysis"]["patterns"]:
-        print(f"  Type: {pattern['type']}")
-        print(f"  Confidence: {pattern['confidence']:.2f}")
+        print(f"  Type: {pattern['type']}", file = buf)
+        print(f"  Confidence: {pattern['confidence']:.2f}", file = buf)
 
-    print("\nPredicted Evolution:")
+    print("\nPredicted Evolution:", file = buf)
     for i, step in enumerate(result["evolution"]["stability_trajectory"]):
-        print(f"  Step {i+1} Stability: {step:.2f}")
+        print(f"  Step {i+1} Stability: {step:.2f}", file = buf)
 
-    print("\nGenerated Insights:")
+    print("\nGenerated Insights:", file = buf)
     for insight in result["insights"]:
-        print(f"  {insight['description']}")
-        print(f"  Implications:")
+        print(f"  {insight['description']}", file = buf)
+        print(f"  Implications:", file = buf)
         for implication in insight["implications"]:
-            print(f"    - {implication}")
-
-def example_pattern_comparison():
-    """Example of comparing relationship patterns"""
-    print("\n===== Relationship Pattern Comparison Example =====")
+            print(f"    - {implication}", file = buf)
 
-    # Initialize integrated detector
-    detector = IntegratedDetector()
+    with _print_lock:
+        sys.stdout.write(buf.getvalue())
 
+def example_pattern_comparison(detector):
+    """Example of comparing relationship patterns"""
     # Example relationship data for two different relationships
     relationship_a = {
         "persons": ["A", "B"],
@@ -435,42 +604,52 @@ def example_pattern_comparison():
     # Compare patterns
     result = detector.compare_relationship_patterns(relationship_a, relationship_b)
 
-    # Print results
-    print("\nComparison Results:")
-    print(f"  Isomorphic: {result['comparison']['isomorphism_analysis']['isomorphic']}")
-    print(f"  Similarity Score: {result['comparison']['isomorphism_analysis']['similarity_score']:.2f}")
+    # Print results in a single write
+    buf = io.StringIO()
+    print("\n===== Relationship Pattern Comparison Example =====", file = buf)
+
+    print("\nComparison Results:", file = buf)
+    print(f"  Isomorphic: {result['comparison']['isomorphism_analysis']['isomorphic']}", file = buf)
+    print(f"  Similarity Score: {result['comparison']['isomorphism_analysis']['similarity_score']:.2f}", file = buf)
 
-    print("\nCommon Patterns:")
+    print("\nCommon Patterns:", file = buf)
     for pattern in result['comparison']['common_patterns']:
-        print(f"  Type: {pattern['type']}")
-        print(f"  Similarity: {pattern['similarity']:.2f}")
+        print(f"  Type: {pattern['type']}", file = buf)
+        print(f"  Similarity: {pattern['similarity']:.2f}", file = buf)
 
-    print("\nGenerated Insights:")
+    print("\nGenerated Insights:", file = buf)
     for insight in result["insights"]:
-        print(f"  {insight['description']}")
-        print(f"  Similarity: {insight.get('similarity', 'N/A')}")
-        print(f"  Implications:")
+        print(f"  {insight['description']}", file = buf)
+        print(f"  Similarity: {insight.get('similarity', 'N/A')}", file = buf)
+        print(f"  Implications:", file = buf)
         for implication in insight["implications"]:
-            print(f"    - {implication}")
+            print(f"    - {implication}", file = buf)
+
+    with _print_lock:
+        sys.stdout.write(buf.getvalue())
 
 def main():
     """Main function to run examples"""
     print("BAZINGA Framework Integration with Meta-Pattern Recognition System\n")
 
-    try:
-        example_claude_integration()
-    except Exception as e:
-        logger.error(f"Error running Claude integration example: {e}")
+    # Initialize the integrated detector once and share it across examples
+    detector = IntegratedDetector()
 
-    try:
-        example_relationship_analysis()
-    except Exception as e:
-        logger.error(f"Error running relationship analysis example: {e}")
+    # The examples are independent and mostly wait on the connectors, so run
+    # them concurrently
+    examples = {
+        "Claude integration": example_claude_integration,
+        "relationship analysis": example_relationship_analysis,
+        "pattern comparison": example_pattern_comparison
+    }
 
-    try:
-        example_pattern_comparison()
-    except Exception as e:
-        logger.error(f"Error running pattern comparison example: {e}")
+    with concurrent.futures.ThreadPoolExecutor(max_workers = len(examples)) as executor:
+        futures = {executor.submit(example, detector): name for name, example in examples.items()}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("Error running %s example: %s", futures[future], e)
 
 if __name__ == "__main__":
     main()
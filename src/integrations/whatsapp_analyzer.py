@@ -6,62 +6,121 @@ Integrates with CHRONOS-ANAMNESIS phi-resonant system
 
 import os
 import re
+import copy
 import json
-import datetime
+import hashlib
+import shutil
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Render straight to PNG, no GUI toolkit
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
 import matplotlib.dates as mdates
 from collections import Counter
-import networkx as nx
-from wordcloud import WordCloud
+from jinja2 import Environment, FileSystemLoader
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
-from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Constants
 PHI = 1.618033988749895
 PHI_INVERSE = 0.618033988749895
 DODO_PATTERN = [5, 1, 1, 2, 3, 4, 5, 1]
+CHART_DPI = 80
+DAYS_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+DAY_OF_WEEK_DTYPE = pd.CategoricalDtype(categories=DAYS_ORDER, ordered=True)
+STATS_VERSION = 4  # bump when the saved summary statistics change shape
+
+# messages_df columns each chart reads, so chart worker processes get only those
+CHART_COLUMNS = {
+    'create_timeseries_chart': ('timestamp', 'message', 'sentiment'),
+    'create_heatmap': ('day_of_week', 'hour'),
+    'create_word_cloud': ('sender', 'message'),
+    'create_radar_chart': ('timestamp', 'message', 'sentiment')
+}
 
 # Initialize NLTK components
 try:
-    nltk.data.find('tokenizers/punkt')
     nltk.data.find('sentiment/vader_lexicon.zip')
     nltk.data.find('corpora/stopwords')
 except LookupError:
     print("Downloading NLTK resources...")
-    nltk.download('punkt')
     nltk.download('vader_lexicon')
     nltk.download('stopwords')
 
+# Report templates, compiled once and cached for the life of the process
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=-1,
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+
+# Shared NLTK resources, loaded once per process
+STOP_WORDS = frozenset(stopwords.words('english')) | {'https', 'http', 'www', 'com', 'image', 'omitted', 'media'}
+SENTIMENT_ANALYZER = SentimentIntensityAnalyzer()
+
 # Message pattern for WhatsApp export format
-WHATSAPP_MSG_PATTERN = r'\[?(\d{1,2}/\d{1,2}/\d{2,4}),? (\d{1,2}:\d{2}(?::\d{2})?(?: [AP]M)?)\]? - ([^:]+): (.+)'
+WHATSAPP_MSG_PATTERN = re.compile(r'\[?(\d{1,2}/\d{1,2}/\d{2,4}),? (\d{1,2}:\d{2}(?::\d{2})?(?: [AP]M)?)\]? - ([^:]+): (.+)')
+
+# Time formats used by WhatsApp exports
+TIME_FORMATS = ("%I:%M %p", "%H:%M", "%H:%M:%S")
+
+# Slash-separated date, used to detect the export's date format
+DATE_PATTERN = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{2,4})')
+
+# Placeholder WhatsApp exports in place of attachments
+MEDIA_OMITTED = '<Media omitted>'
+
+# Alphabetic words of two or more letters, for word clouds
+WORD_PATTERN = re.compile(r'[^\W\d_]{2,}')
 
 class WhatsAppAnalyzer:
     """Analyzes WhatsApp chat exports to create phi-resonant patterns and insights"""
     
-    def __init__(self, export_path=None):
+    def __init__(self, export_path=None, sentiment_analyzer=SENTIMENT_ANALYZER):
         """Initialize the analyzer"""
         self.export_path = export_path
-        self.messages = []
         self.messages_df = None
+        self.timestamps = None
         self.date_format = None
         self.first_date = None
         self.last_date = None
         self.duration_days = None
         self.participants = []
         self.phi_boundaries = []
-        self.sentiment_analyzer = SentimentIntensityAnalyzer()
+        self.boundaries_df = None
+        self.sentiment_analyzer = sentiment_analyzer
+        self._sentiment_done = False
+        self._chart_cache = {}
+        self._chart_mtimes = {}
+        self._fingerprint = None
+        self._stats_cache = {}
         self.output_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'whatsapp_analysis')
         
         # Create output folder if it doesn't exist
         if not os.path.exists(self.output_folder):
             os.makedirs(self.output_folder)
             
+    @property
+    def messages(self):
+        """Loaded messages as a list of dicts, built from messages_df (read-only)"""
+        if self.messages_df is None:
+            return []
+        return self.messages_df[['timestamp', 'sender', 'message', 'day_of_week', 'hour']].to_dict('records')
+    
     def load_chat(self, filepath):
         """Load WhatsApp chat export file"""
         print(f"Loading chat from: {filepath}")
@@ -69,76 +128,62 @@ class WhatsAppAnalyzer:
         
         try:
             with open(filepath, 'r', encoding='utf-8') as file:
-                chat_text = file.read()
+                columns, first_date_match = self._read_messages(file)
         except UnicodeDecodeError:
             # Try another encoding if UTF-8 fails
             with open(filepath, 'r', encoding='iso-8859-1') as file:
-                chat_text = file.read()
+                columns, first_date_match = self._read_messages(file)
                 
         # Determine date format
-        if re.search(r'\d{1,2}/\d{1,2}/\d{2,4}', chat_text):
+        if first_date_match:
             # Check if format is MM/DD/YYYY or DD/MM/YYYY
-            first_date_match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{2,4})', chat_text)
-            if first_date_match:
-                month, day, year = first_date_match.groups()
-                # Assume DD/MM/YYYY if day > 12
-                if int(day) > 12:
-                    self.date_format = "%d/%m/%Y"
-                else:
-                    self.date_format = "%m/%d/%Y"
+            month, day, year = first_date_match.groups()
+            # Assume DD/MM/YYYY if day > 12
+            if int(day) > 12:
+                self.date_format = "%d/%m/%Y"
             else:
-                self.date_format = "%d/%m/%Y"  # Default
+                self.date_format = "%m/%d/%Y"
         else:
             self.date_format = "%Y-%m-%d"  # ISO format
                 
-        # Extract messages
-        self.messages = []
-        for match in re.finditer(WHATSAPP_MSG_PATTERN, chat_text):
-            date_str, time_str, sender, message = match.groups()
-            
-            # Parse date
-            try:
-                if self.date_format == "%d/%m/%Y" or self.date_format == "%m/%d/%Y":
-                    if len(date_str.split('/')[-1]) == 2:  # Short year format (YY)
-                        date_str = date_str.rsplit('/', 1)[0] + '/20' + date_str.rsplit('/', 1)[1]
-                date = datetime.datetime.strptime(date_str, self.date_format).date()
-            except ValueError:
-                # Try alternate format
-                try:
-                    alternate_format = "%m/%d/%Y" if self.date_format == "%d/%m/%Y" else "%d/%m/%Y"
-                    date = datetime.datetime.strptime(date_str, alternate_format).date()
-                    self.date_format = alternate_format  # Update format
-                except ValueError:
-                    print(f"Could not parse date: {date_str}")
-                    continue
-            
-            # Parse time
-            try:
-                if "AM" in time_str or "PM" in time_str:
-                    time = datetime.datetime.strptime(time_str, "%I:%M %p").time()
-                else:
-                    time = datetime.datetime.strptime(time_str, "%H:%M").time()
-            except ValueError:
-                try:
-                    time = datetime.datetime.strptime(time_str, "%H:%M:%S").time()
-                except ValueError:
-                    print(f"Could not parse time: {time_str}")
-                    continue
-            
-            # Create datetime
-            timestamp = datetime.datetime.combine(date, time)
-            
-            # Add message to list
-            self.messages.append({
-                'timestamp': timestamp,
-                'sender': sender.strip(),
-                'message': message.strip(),
-                'day_of_week': timestamp.strftime('%A'),
-                'hour': timestamp.hour
-            })
-            
+        raw = pd.DataFrame(columns, dtype=str)
+
+        # Expand short years (YY) and parse date and time together
+        dates = raw['date'].str.replace(r'/(\d{2})$', r'/20\1', regex=True)
+        stamps = dates + ' ' + raw['time']
+        time_formats = self._detect_time_formats(raw['time'])
+        timestamps = self._parse_timestamps(stamps, self.date_format, time_formats)
+
+        if timestamps.isna().any():
+            # Try alternate format; once it parses a row the primary fails on,
+            # it takes precedence for the rest of the chat
+            alternate_format = "%m/%d/%Y" if self.date_format == "%d/%m/%Y" else "%d/%m/%Y"
+            alternate = self._parse_timestamps(stamps, alternate_format, time_formats)
+            switched = (timestamps.isna() & alternate.notna()).to_numpy()
+            if switched.any():
+                after_switch = np.arange(len(stamps)) >= switched.argmax()
+                timestamps = timestamps.where(~after_switch, alternate.fillna(timestamps))
+                self.date_format = alternate_format
+
+        unparsed = int(timestamps.isna().sum())
+        if unparsed:
+            print(f"Could not parse {unparsed} timestamps")
+
         # Create DataFrame
-        self.messages_df = pd.DataFrame(self.messages)
+        parsed = timestamps.notna()
+        timestamps = timestamps[parsed]
+        messages = raw['message'][parsed].str.strip()
+        self.messages_df = pd.DataFrame({
+            'timestamp': timestamps,
+            'sender': raw['sender'][parsed].str.strip().astype('category'),
+            'message': messages,
+            'is_media': messages == MEDIA_OMITTED,
+            'day_of_week': timestamps.dt.day_name().astype(DAY_OF_WEEK_DTYPE),
+            'hour': timestamps.dt.hour.astype('int8')
+        }).sort_values('timestamp', kind='stable', ignore_index=True)
+        self.timestamps = self.messages_df['timestamp'].to_numpy(dtype='datetime64[ns]')
+        self._sentiment_done = False
+        self._fingerprint = None
         
         # Set first and last date
         if not self.messages_df.empty:
@@ -152,36 +197,100 @@ class WhatsAppAnalyzer:
             # Calculate phi-resonant boundaries
             self.calculate_phi_boundaries()
             
-            print(f"Loaded {len(self.messages)} messages from {len(self.participants)} participants")
+            print(f"Loaded {len(self.messages_df)} messages from {len(self.participants)} participants")
             print(f"Date range: {self.first_date.date()} to {self.last_date.date()} ({self.duration_days} days)")
         
         return self.messages_df
     
+    def _read_messages(self, file):
+        """Stream an export line by line into date, time, sender and message columns
+        
+        Lines that don't start a new message are continuations of the previous one.
+        Also returns the first date match, for detecting the date format.
+        """
+        dates, times, senders, messages = [], [], [], []
+        first_date_match = None
+        for line in file:
+            if first_date_match is None:
+                first_date_match = DATE_PATTERN.search(line)
+            match = WHATSAPP_MSG_PATTERN.search(line)
+            if match:
+                date, time, sender, message = match.groups()
+                dates.append(date)
+                times.append(time)
+                senders.append(sender)
+                messages.append(message)
+            elif messages:
+                messages[-1] += '\n' + line.rstrip('\r\n')
+        columns = {'date': dates, 'time': times, 'sender': senders, 'message': messages}
+        return columns, first_date_match
+    
+    def _detect_time_formats(self, times, sample_size=50):
+        """Order TIME_FORMATS so the one used by the first messages is tried first"""
+        sample = times.head(sample_size)
+        if sample.str.endswith('M').any():
+            detected = "%I:%M %p"
+        elif (sample.str.count(':') > 1).any():
+            detected = "%H:%M:%S"
+        else:
+            detected = "%H:%M"
+        return [detected] + [time_format for time_format in TIME_FORMATS if time_format != detected]
+    
+    def _parse_timestamps(self, stamps, date_format, time_formats):
+        """Parse 'date time' strings with the detected time format, retrying only rows it misses"""
+        timestamps = pd.to_datetime(stamps, format=f"{date_format} {time_formats[0]}", cache=True, errors='coerce')
+        for time_format in time_formats[1:]:
+            missing = timestamps.isna()
+            if not missing.any():
+                break
+            timestamps[missing] = pd.to_datetime(
+                stamps[missing], format=f"{date_format} {time_format}", cache=True, errors='coerce'
+            )
+        return timestamps
+    
+    def _chart_key(self, method_name, output_path, sender=None):
+        """Cache key for a rendered chart: data fingerprint, output path and sender"""
+        return (method_name, self._data_fingerprint(), output_path, sender)
+    
+    def _chart_is_cached(self, cache_key):
+        """Check whether this analyzer rendered the chart for these inputs and the image is unchanged since"""
+        try:
+            image_mtime = os.stat(cache_key[2]).st_mtime_ns
+        except OSError:
+            return False
+        return self._chart_mtimes.get(cache_key) == image_mtime
+    
+    def _store_chart(self, cache_key, result):
+        """Remember a rendered chart's result and the mtime of the image it wrote"""
+        self._chart_cache[cache_key] = result
+        self._chart_mtimes[cache_key] = os.stat(cache_key[2]).st_mtime_ns
+    
+    def _chart_worker(self, method_name):
+        """Copy of the analyzer holding only the columns one chart reads, for a worker process"""
+        worker = copy.copy(self)
+        worker.messages_df = self.messages_df[list(CHART_COLUMNS[method_name])]
+        worker.sentiment_analyzer = None
+        worker._chart_cache = {}
+        worker._chart_mtimes = {}
+        worker._stats_cache = {}
+        worker._fingerprint = (worker.messages_df, self._data_fingerprint())
+        return worker
+    
     def calculate_phi_boundaries(self):
         """Calculate phi-resonant boundary dates in the timeline"""
         if self.first_date and self.last_date:
-            total_seconds = (self.last_date - self.first_date).total_seconds()
-            
-            # Calculate boundaries using phi and inverse phi
-            phi_point = self.first_date + datetime.timedelta(seconds=total_seconds * PHI_INVERSE)
-            inv_phi_point = self.first_date + datetime.timedelta(seconds=total_seconds * (1 - PHI_INVERSE))
+            # Phi and inverse phi, then the DODO pattern points
+            dodo_total = len(DODO_PATTERN)
+            positions = np.array([PHI_INVERSE, 1 - PHI_INVERSE] + [i / dodo_total for i in range(dodo_total)])
+            types = ["φ⁻¹", "1-φ⁻¹"] + [f"DODO-{value}" for value in DODO_PATTERN]
             
-            # Add points to list
-            self.phi_boundaries = [
-                {"position": PHI_INVERSE, "date": phi_point, "type": "φ⁻¹"},
-                {"position": (1 - PHI_INVERSE), "date": inv_phi_point, "type": "1-φ⁻¹"}
-            ]
+            # Offset the first date by each fraction of the timeline, in nanoseconds
+            first = self.first_date.to_datetime64().astype('datetime64[ns]')
+            total_ns = (self.last_date - self.first_date).value
+            dates = first + (positions * total_ns).astype('int64').astype('timedelta64[ns]')
             
-            # Add DODO pattern points
-            dodo_total = len(DODO_PATTERN)
-            for i, value in enumerate(DODO_PATTERN):
-                position = i / dodo_total
-                date = self.first_date + datetime.timedelta(seconds=total_seconds * position)
-                self.phi_boundaries.append({
-                    "position": position,
-                    "date": date,
-                    "type": f"DODO-{value}"
-                })
+            self.boundaries_df = pd.DataFrame({'position': positions, 'date': dates, 'type': types})
+            self.phi_boundaries = self.boundaries_df.to_dict('records')
     
     def add_sentiment_analysis(self):
         """Add sentiment analysis to the messages dataframe"""
@@ -191,13 +300,15 @@ class WhatsAppAnalyzer:
         
         print("Performing sentiment analysis...")
         
-        # Function to calculate sentiment
-        def get_sentiment(text):
-            scores = self.sentiment_analyzer.polarity_scores(text)
-            return scores['compound']
-        
-        # Apply to all messages
-        self.messages_df['sentiment'] = self.messages_df['message'].apply(get_sentiment)
+        # Score each distinct message once and broadcast back by code
+        codes, unique_messages = pd.factorize(self.messages_df['message'])
+        polarity_scores = self.sentiment_analyzer.polarity_scores
+        unique_scores = np.fromiter(
+            (polarity_scores(text)['compound'] for text in unique_messages),
+            dtype=np.float32,
+            count=len(unique_messages)
+        )
+        self.messages_df['sentiment'] = unique_scores[codes]
         
         # Categorize sentiment
         self.messages_df['sentiment_category'] = pd.cut(
@@ -206,20 +317,32 @@ class WhatsAppAnalyzer:
             labels=['very negative', 'negative', 'neutral', 'positive', 'very positive']
         )
         
+        self._sentiment_done = True
+        self._fingerprint = None
         print("Sentiment analysis complete.")
         return self.messages_df
     
+    def _ensure_sentiment(self):
+        """Run sentiment analysis unless it has already been done for the loaded chat"""
+        if not self._sentiment_done:
+            self.add_sentiment_analysis()
+    
     def create_timeseries_chart(self, output_file=None):
         """Create time series chart of message frequency and sentiment"""
         if self.messages_df is None or self.messages_df.empty:
             print("No messages loaded. Load chat first.")
             return
         
-        print("Creating time series chart...")
+        # Ensure sentiment is calculated (it is part of the data the cache key covers)
+        self._ensure_sentiment()
         
-        # Ensure sentiment is calculated
-        if 'sentiment' not in self.messages_df.columns:
-            self.add_sentiment_analysis()
+        output_path = output_file or os.path.join(self.output_folder, 'timeseries_chart.png')
+        cache_key = self._chart_key('create_timeseries_chart', output_path)
+        if self._chart_is_cached(cache_key):
+            print(f"Time series chart up to date at {output_path}")
+            return self._chart_cache[cache_key]
+        
+        print("Creating time series chart...")
         
         # Create daily message count and average sentiment
         daily_data = self.messages_df.groupby(self.messages_df['timestamp'].dt.date).agg({
@@ -230,21 +353,21 @@ class WhatsAppAnalyzer:
         
         # Calculate 7-day rolling averages
         daily_data['message_count_rolling'] = daily_data['message_count'].rolling(window=7).mean()
-        daily_data['avg_sentiment_rolling'] = daily_data['sentiment'].rolling(window=7).mean()
+        daily_data['avg_sentiment_rolling'] = daily_data['avg_sentiment'].rolling(window=7).mean()
         
         # Create the figure
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
         fig.suptitle('WhatsApp Chat Analysis: Time Series', fontsize=16)
         
         # Plot message count
-        ax1.plot(daily_data.index, daily_data['message_count'], 'b-', alpha=0.3, label='Daily Count')
+        ax1.plot(daily_data.index, daily_data['message_count'], 'b-', alpha=0.3, label='Daily Count', rasterized=True)
         ax1.plot(daily_data.index, daily_data['message_count_rolling'], 'b-', linewidth=2, label='7-day Avg')
         ax1.set_ylabel('Message Count')
         ax1.legend()
         ax1.grid(True, alpha=0.3)
         
         # Plot sentiment
-        ax2.plot(daily_data.index, daily_data['avg_sentiment'], 'g-', alpha=0.3, label='Daily Sentiment')
+        ax2.plot(daily_data.index, daily_data['avg_sentiment'], 'g-', alpha=0.3, label='Daily Sentiment', rasterized=True)
         ax2.plot(daily_data.index, daily_data['avg_sentiment_rolling'], 'g-', linewidth=2, label='7-day Avg')
         ax2.set_ylabel('Sentiment (-1 to 1)')
         ax2.set_ylim(-1, 1)
@@ -266,19 +389,13 @@ class WhatsAppAnalyzer:
                 ax1.text(date, ax1.get_ylim()[1] * 0.9, boundary['type'], 
                         rotation=90, verticalalignment='top')
         
-        plt.tight_layout()
-        
         # Save or display
-        if output_file:
-            plt.savefig(output_file)
-            print(f"Time series chart saved to {output_file}")
-        else:
-            output_path = os.path.join(self.output_folder, 'timeseries_chart.png')
-            plt.savefig(output_path)
-            print(f"Time series chart saved to {output_path}")
+        plt.savefig(output_path, dpi=CHART_DPI, bbox_inches='tight')
+        print(f"Time series chart saved to {output_path}")
         
         plt.close()
         
+        self._store_chart(cache_key, daily_data)
         return daily_data
     
     def create_heatmap(self, output_file=None):
@@ -287,28 +404,24 @@ class WhatsAppAnalyzer:
             print("No messages loaded. Load chat first.")
             return
         
+        output_path = output_file or os.path.join(self.output_folder, 'message_heatmap.png')
+        cache_key = self._chart_key('create_heatmap', output_path)
+        if self._chart_is_cached(cache_key):
+            print(f"Heatmap up to date at {output_path}")
+            return self._chart_cache[cache_key]
+        
         print("Creating message frequency heatmap...")
         
-        # Extract day of week and hour
-        self.messages_df['day_name'] = self.messages_df['timestamp'].dt.day_name()
-        self.messages_df['hour'] = self.messages_df['timestamp'].dt.hour
-        
-        # Define order of days
-        days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
-        # Create pivot table
-        heatmap_data = pd.pivot_table(
-            self.messages_df, 
-            values='message', 
-            index='day_name',
-            columns='hour', 
-            aggfunc='count', 
-            fill_value=0
+        # Count messages per (day, hour) cell; day codes follow the Monday-Sunday category order
+        day_codes = self.messages_df['day_of_week'].cat.codes.to_numpy(dtype=np.intp)
+        hours = self.messages_df['hour'].to_numpy(dtype=np.intp)
+        counts = np.bincount(day_codes * 24 + hours, minlength=len(DAYS_ORDER) * 24)
+        heatmap_data = pd.DataFrame(
+            counts.reshape(len(DAYS_ORDER), 24),
+            index=pd.Index(DAYS_ORDER, name='day_of_week'),
+            columns=pd.RangeIndex(24, name='hour')
         )
         
-        # Reorder days
-        heatmap_data = heatmap_data.reindex(days_order)
-        
         # Create the heatmap
         plt.figure(figsize=(12, 6))
         
@@ -317,13 +430,13 @@ class WhatsAppAnalyzer:
         cmap = LinearSegmentedColormap.from_list('phi_cmap', colors, N=100)
         
         ax = plt.subplot(111)
-        im = ax.imshow(heatmap_data, cmap=cmap)
+        im = ax.imshow(heatmap_data, cmap=cmap, rasterized=True)
         
         # Set labels
         ax.set_xticks(np.arange(24))
         ax.set_xticklabels([f"{h}:00" for h in range(24)])
-        ax.set_yticks(np.arange(len(days_order)))
-        ax.set_yticklabels(days_order)
+        ax.set_yticks(np.arange(len(DAYS_ORDER)))
+        ax.set_yticklabels(DAYS_ORDER)
         
         # Add colorbar
         cbar = plt.colorbar(im)
@@ -331,19 +444,13 @@ class WhatsAppAnalyzer:
         
         plt.title('Message Frequency by Day and Hour', fontsize=16)
         plt.xlabel('Hour of Day')
-        plt.tight_layout()
-        
         # Save or display
-        if output_file:
-            plt.savefig(output_file)
-            print(f"Heatmap saved to {output_file}")
-        else:
-            output_path = os.path.join(self.output_folder, 'message_heatmap.png')
-            plt.savefig(output_path)
-            print(f"Heatmap saved to {output_path}")
+        plt.savefig(output_path, dpi=CHART_DPI, bbox_inches='tight')
+        print(f"Heatmap saved to {output_path}")
         
         plt.close()
         
+        self._store_chart(cache_key, heatmap_data)
         return heatmap_data
     
     def create_word_cloud(self, sender=None, output_file=None):
@@ -352,51 +459,48 @@ class WhatsAppAnalyzer:
             print("No messages loaded. Load chat first.")
             return
         
+        sender_suffix = f"_{sender.replace(' ', '_')}" if sender else ""
+        output_path = output_file or os.path.join(self.output_folder, f'wordcloud{sender_suffix}.png')
+        cache_key = self._chart_key('create_word_cloud', output_path, sender)
+        if self._chart_is_cached(cache_key):
+            print(f"Word cloud up to date at {output_path}")
+            return
+        
         print("Creating word cloud...")
         
         # Filter by sender if specified
         if sender:
-            text_data = ' '.join(self.messages_df[self.messages_df['sender'] == sender]['message'])
+            messages = self.messages_df.loc[self.messages_df['sender'] == sender, 'message']
             title_suffix = f" - {sender}"
         else:
-            text_data = ' '.join(self.messages_df['message'])
+            messages = self.messages_df['message']
             title_suffix = ""
+        text_data = ' '.join(messages.to_numpy()).lower()
         
-        # Process text
-        stop_words = set(stopwords.words('english'))
-        stop_words.update(['https', 'http', 'www', 'com', 'image', 'omitted', 'Media'])
-        
-        # Tokenize and filter text
-        words = word_tokenize(text_data)
-        filtered_words = [word.lower() for word in words if word.isalpha() and word.lower() not in stop_words]
-        text_data = ' '.join(filtered_words)
+        # Tokenize and count words, skipping stop words
+        word_counts = Counter(word for word in WORD_PATTERN.findall(text_data) if word not in STOP_WORDS)
         
-        # Generate word cloud
+        # Generate word cloud (imported here: only this chart needs it)
+        from wordcloud import WordCloud
         wordcloud = WordCloud(
             width=800, 
             height=400,
             background_color='white', 
             max_words=100
-        ).generate(text_data)
+        ).generate_from_frequencies(dict(word_counts.most_common(100)))
         
         # Create plot
         plt.figure(figsize=(10, 5))
-        plt.imshow(wordcloud, interpolation='bilinear')
+        plt.imshow(wordcloud, interpolation='bilinear', rasterized=True)
         plt.axis('off')
         plt.title(f"Word Cloud{title_suffix}", fontsize=16)
-        plt.tight_layout()
-        
         # Save or display
-        if output_file:
-            plt.savefig(output_file)
-            print(f"Word cloud saved to {output_file}")
-        else:
-            sender_suffix = f"_{sender.replace(' ', '_')}" if sender else ""
-            output_path = os.path.join(self.output_folder, f'wordcloud{sender_suffix}.png')
-            plt.savefig(output_path)
-            print(f"Word cloud saved to {output_path}")
+        plt.savefig(output_path, dpi=CHART_DPI, bbox_inches='tight')
+        print(f"Word cloud saved to {output_path}")
         
         plt.close()
+        
+        self._store_chart(cache_key, None)
     
     def create_radar_chart(self, output_file=None):
         """Create radar chart of communication patterns aligned with DODO pattern"""
@@ -404,35 +508,48 @@ class WhatsAppAnalyzer:
             print("No messages loaded. Load chat first.")
             return
         
+        # Ensure sentiment is calculated (it is part of the data the cache key covers)
+        self._ensure_sentiment()
+        
+        output_path = output_file or os.path.join(self.output_folder, 'dodo_radar_chart.png')
+        cache_key = self._chart_key('create_radar_chart', output_path)
+        if self._chart_is_cached(cache_key):
+            print(f"DODO radar chart up to date at {output_path}")
+            return self._chart_cache[cache_key]
+        
         print("Creating DODO pattern radar chart...")
         
-        # Ensure sentiment is calculated
-        if 'sentiment' not in self.messages_df.columns:
-            self.add_sentiment_analysis()
-            
         # Create normalized time periods based on DODO pattern
         duration = (self.last_date - self.first_date).total_seconds()
         period_duration = duration / len(DODO_PATTERN)
         
+        # Assign every message to its period and aggregate all periods at once
+        period_ns = max(int(duration * 1e9 / len(DODO_PATTERN)), 1)
+        period_id = np.minimum(
+            (self.timestamps.astype('int64') - self.first_date.value) // period_ns,
+            len(DODO_PATTERN) - 1
+        )
+        period_stats = self.messages_df.assign(
+            period_id=period_id,
+            day=self.messages_df['timestamp'].dt.normalize()
+        ).groupby('period_id').agg(
+            message_count=('message', 'size'),
+            avg_sentiment=('sentiment', 'mean'),
+            unique_days=('day', 'nunique')
+        ).reindex(range(len(DODO_PATTERN)), fill_value=0)
+        
+        # Busiest day, for normalizing message counts
+        max_msgs = self.messages_df.groupby(pd.Grouper(key='timestamp', freq='D')).size().max()
+        
         # Initialize metrics for each period
         periods = []
-        for i, value in enumerate(DODO_PATTERN):
-            start_time = self.first_date + datetime.timedelta(seconds=i * period_duration)
-            end_time = self.first_date + datetime.timedelta(seconds=(i + 1) * period_duration)
-            
-            # Filter messages in this period
-            period_messages = self.messages_df[
-                (self.messages_df['timestamp'] >= start_time) & 
-                (self.messages_df['timestamp'] < end_time)
-            ]
-            
+        for i, (value, row) in enumerate(zip(DODO_PATTERN, period_stats.itertuples())):
             # Calculate metrics
-            message_count = len(period_messages)
-            avg_sentiment = period_messages['sentiment'].mean() if not period_messages.empty else 0
-            unique_days = period_messages['timestamp'].dt.date.nunique() if not period_messages.empty else 0
+            message_count = int(row.message_count)
+            avg_sentiment = row.avg_sentiment
+            unique_days = int(row.unique_days)
             
             # Normalize between 0 and 1
-            max_msgs = self.messages_df.groupby(pd.Grouper(key='timestamp', freq='D')).size().max()
             normalized_count = message_count / (max_msgs * 30) if max_msgs > 0 else 0
             normalized_sentiment = (avg_sentiment + 1) / 2  # Convert from [-1,1] to [0,1]
             normalized_days = unique_days / 30 if period_duration > 0 else 0
@@ -479,16 +596,12 @@ class WhatsAppAnalyzer:
         plt.title('DODO Pattern Alignment (5.1.1.2.3.4.5.1)', fontsize=16)
         
         # Save or display
-        if output_file:
-            plt.savefig(output_file)
-            print(f"DODO radar chart saved to {output_file}")
-        else:
-            output_path = os.path.join(self.output_folder, 'dodo_radar_chart.png')
-            plt.savefig(output_path)
-            print(f"DODO radar chart saved to {output_path}")
+        plt.savefig(output_path, dpi=CHART_DPI, bbox_inches='tight')
+        print(f"DODO radar chart saved to {output_path}")
         
         plt.close()
         
+        self._store_chart(cache_key, periods)
         return periods
     
     def calculate_interaction_network(self, output_file=None):
@@ -499,90 +612,108 @@ class WhatsAppAnalyzer:
         
         print("Calculating interaction network...")
         
-        # Create a directed graph
+        # Ensure sentiment is calculated
+        self._ensure_sentiment()
+        
+        # Create a directed graph (imported here: only this chart needs it)
+        import networkx as nx
         G = nx.DiGraph()
         
         # Add nodes (participants)
-        for participant in self.participants:
-            G.add_node(participant)
+        G.add_nodes_from(self.participants)
         
-        # Calculate interactions
-        participant_counts = {}
+        # Count messages and average sentiment per sender
+        participant_counts = self.messages_df['sender'].value_counts().to_dict()
+        sender_sentiment = self.messages_df.groupby('sender', observed=True)['sentiment'].mean()
         for sender in self.participants:
-            # Count messages from this sender
-            sender_messages = self.messages_df[self.messages_df['sender'] == sender]
-            count = len(sender_messages)
-            participant_counts[sender] = count
-            
-            # Calculate message sentiment
-            if 'sentiment' not in self.messages_df.columns:
-                self.add_sentiment_analysis()
-            avg_sentiment = sender_messages['sentiment'].mean() if not sender_messages.empty else 0
-            
-            # Add attributes to node
-            G.nodes[sender]['messages'] = count
-            G.nodes[sender]['sentiment'] = avg_sentiment
+            G.nodes[sender]['messages'] = participant_counts.get(sender, 0)
+            G.nodes[sender]['sentiment'] = sender_sentiment.get(sender, 0)
         
         # Get replies (mentioned in messages)
-        for participant in self.participants:
-            for other in self.participants:
-                if participant == other:
-                    continue
-                
-                # Count mentions and patterns that indicate replies
-                mentions = self.messages_df[
-                    (self.messages_df['sender'] == participant) & 
-                    (self.messages_df['message'].str.contains(other, regex=False, case=False))
-                ].shape[0]
-                
-                if mentions > 0:
-                    G.add_edge(participant, other, weight=mentions)
+        mentions = self._count_mentions()
+        G.add_weighted_edges_from(
+            (participant, other, mentions[participant, other])
+            for participant in self.participants
+            for other in self.participants
+            if participant != other and mentions[participant, other] > 0
+        )
         
         # Plot the network
         plt.figure(figsize=(10, 8))
         
         # Node sizes based on message count
-        node_sizes = [participant_counts.get(p, 10) * 0.5 for p in G.nodes()]
+        node_sizes = np.array([participant_counts.get(p, 10) for p in G.nodes()]) * 0.5
         
         # Node colors based on sentiment
-        node_colors = [G.nodes[p].get('sentiment', 0) for p in G.nodes()]
+        node_colors = np.array([G.nodes[p].get('sentiment', 0) for p in G.nodes()], dtype=float)
+        
+        # Edge widths based on mention count
+        edge_widths = np.array([d.get('weight', 1) for _, _, d in G.edges(data=True)]) * 0.5
         
         # Create colormap
         cmap = plt.cm.coolwarm
         
         # Draw the graph
-        pos = nx.spring_layout(G, seed=42)
-        nx.draw_networkx_nodes(G, pos, node_size=node_sizes, node_color=node_colors, cmap=cmap, alpha=0.8)
+        ax = plt.gca()
+        pos = nx.spring_layout(G, seed=42, iterations=50)
+        nodes = nx.draw_networkx_nodes(G, pos, node_size=node_sizes, node_color=node_colors, cmap=cmap, alpha=0.8, ax=ax)
         
-        # Draw edges with varying width
-        for (u, v, d) in G.edges(data=True):
-            width = d.get('weight', 1) * 0.5
-            nx.draw_networkx_edges(G, pos, edgelist=[(u, v)], width=width, alpha=0.6)
+        # Draw all edges in one call, with varying width
+        nx.draw_networkx_edges(G, pos, width=edge_widths, node_size=node_sizes, alpha=0.6, ax=ax)
         
         # Draw labels
-        nx.draw_networkx_labels(G, pos, font_size=10)
+        nx.draw_networkx_labels(G, pos, font_size=10, ax=ax)
         
         plt.axis('off')
         plt.title('Interaction Network', fontsize=16)
         
-        # Add colorbar legend for sentiment
-        sm = plt.cm.ScalarMappable(cmap=cmap)
-        sm.set_array(node_colors)
-        plt.colorbar(sm, label='Sentiment (-1 to 1)')
+        # Add colorbar legend for sentiment, using the node collection's color mapping
+        plt.colorbar(nodes, ax=ax, label='Sentiment (-1 to 1)')
         
         # Save or display
         if output_file:
-            plt.savefig(output_file)
+            plt.savefig(output_file, dpi=CHART_DPI, bbox_inches='tight')
             print(f"Interaction network saved to {output_file}")
         else:
             output_path = os.path.join(self.output_folder, 'interaction_network.png')
-            plt.savefig(output_path)
+            plt.savefig(output_path, dpi=CHART_DPI, bbox_inches='tight')
             print(f"Interaction network saved to {output_path}")
         
         plt.close()
         
         return G
     
+    def _count_mentions(self):
+        """Count messages in which each sender mentions another participant by name"""
+        senders = self.messages_df['sender'].to_numpy(dtype=object)
+        messages = self.messages_df['message'].str.lower()
+        mentions = Counter()
+        
+        if AHOCORASICK_AVAILABLE:
+            # One automaton scan per message finds every participant name it contains
+            names = {}
+            for participant in self.participants:
+                names.setdefault(participant.lower(), []).append(participant)
+            automaton = ahocorasick.Automaton()
+            for name, participants in names.items():
+                automaton.add_word(name, participants)
+            automaton.make_automaton()
+            
+            for sender, message in zip(senders, messages.to_numpy()):
+                mentioned = {other for _, participants in automaton.iter(message) for other in participants}
+                mentioned.discard(sender)
+                for other in mentioned:
+                    mentions[sender, other] += 1
+        else:
+            # One substring pass per participant over the lowercased messages
+            for other in self.participants:
+                mentioned = messages.str.contains(other.lower(), regex=False).to_numpy()
+                for sender, count in Counter(senders[mentioned]).items():
+                    if sender != other:
+                        mentions[sender, other] += count
+        
+        return mentions
+    
     def calculate_phi_resonant_events(self, num_events=10):
         """Find events at phi-resonant points in the timeline"""
         if self.messages_df is None or self.messages_df.empty:
@@ -595,35 +726,40 @@ class WhatsAppAnalyzer:
         if not self.phi_boundaries:
             self.calculate_phi_boundaries()
         
-        # Find messages near phi-resonant points
+        # Find the closest message to each boundary (within 12 hours) in one merge pass
+        window = pd.Timedelta(hours=12)
+        message_rows = pd.DataFrame({'timestamp': self.timestamps, 'row': np.arange(len(self.timestamps))})
+        nearest = pd.merge_asof(
+            self.boundaries_df.sort_values('date'),
+            message_rows,
+            left_on='date',
+            right_on='timestamp',
+            direction='nearest',
+            tolerance=window
+        )
+        
         phi_events = []
-        for boundary in self.phi_boundaries:
-            boundary_date = boundary['date']
-            
-            # Find closest messages (within 12 hours)
-            window = datetime.timedelta(hours=12)
-            nearby_messages = self.messages_df[
-                (self.messages_df['timestamp'] >= boundary_date - window) &
-                (self.messages_df['timestamp'] <= boundary_date + window)
-            ]
+        for boundary in nearest.dropna(subset=['row']).itertuples(index=False):
+            # messages_df is sorted by timestamp, so the 3 closest messages sit
+            # within two rows either side of the nearest one
+            row = int(boundary.row)
+            lo, hi = max(row - 2, 0), min(row + 3, len(self.timestamps))
+            diffs = np.abs((self.timestamps[lo:hi] - boundary.date.to_datetime64()).astype('int64'))
+            candidates = np.flatnonzero(diffs <= window.value)
+            top = candidates[np.argsort(diffs[candidates], kind='stable')[:3]]
+            top_messages = self.messages_df.iloc[lo + top]
             
-            if not nearby_messages.empty:
-                # Sort by closeness to boundary
-                nearby_messages['time_diff'] = abs((nearby_messages['timestamp'] - boundary_date).dt.total_seconds())
-                nearby_messages = nearby_messages.sort_values('time_diff')
-                
-                # Take top messages
-                top_messages = nearby_messages.head(3)
-                
-                for _, msg in top_messages.iterrows():
-                    phi_events.append({
-                        'timestamp': msg['timestamp'],
-                        'sender': msg['sender'],
-                        'message': msg['message'],
-                        'boundary_type': boundary['type'],
-                        'time_diff_hours': msg['time_diff'] / 3600,
-                        'position': boundary['position']
-                    })
+            for timestamp, sender, message, diff in zip(
+                top_messages['timestamp'], top_messages['sender'], top_messages['message'], diffs[top]
+            ):
+                phi_events.append({
+                    'timestamp': timestamp,
+                    'sender': sender,
+                    'message': message,
+                    'boundary_type': boundary.type,
+                    'time_diff_hours': int(diff) / 3.6e12,
+                    'position': boundary.position
+                })
         
         # Sort by position and time difference
         phi_events.sort(key=lambda x: (x['position'], x['time_diff_hours']))
@@ -637,6 +773,14 @@ class WhatsAppAnalyzer:
             print("No messages loaded. Load chat first.")
             return {}
         
+        # Reuse statistics for unchanged data, from memory or the last saved run;
+        # callers get their own copy so edits never reach the cache
+        fingerprint = self._data_fingerprint()
+        stats = self._stats_cache.get(fingerprint) or self._load_stats(fingerprint)
+        if stats:
+            self._stats_cache[fingerprint] = stats
+            return copy.deepcopy(stats)
+        
         print("Generating summary statistics...")
         
         # Basic statistics
@@ -644,50 +788,62 @@ class WhatsAppAnalyzer:
         total_days = self.duration_days
         avg_msgs_per_day = total_messages / total_days if total_days > 0 else 0
         
-        # Message count by sender
-        sender_counts = self.messages_df['sender'].value_counts().to_dict()
-        
-        # Most active days
-        daily_counts = self.messages_df.groupby(self.messages_df['timestamp'].dt.date).size()
-        most_active_date = daily_counts.idxmax()
-        max_daily_count = daily_counts.max()
+        # Message count by sender, busiest first, with each sender's share of all
+        # messages pre-formatted so the report template only prints it
+        sender_series = self.messages_df['sender'].value_counts()
+        sender_counts = sender_series.to_dict()
+        sender_pct = sender_series.to_numpy() / total_messages * 100
+        participant_rows = list(zip(
+            sender_series.index.tolist(),
+            sender_series.tolist(),
+            [f"{pct:.1f}" for pct in sender_pct.tolist()]
+        ))
+        
+        # Most active days (timestamps are sorted, so days come out in order)
+        days, daily_counts = np.unique(self.timestamps.astype('datetime64[D]'), return_counts=True)
+        busiest_day = daily_counts.argmax()
+        most_active_date = pd.Timestamp(days[busiest_day])
+        max_daily_count = daily_counts[busiest_day]
         
         # Most active hours
-        hourly_counts = self.messages_df.groupby(self.messages_df['timestamp'].dt.hour).size()
-        most_active_hour = hourly_counts.idxmax()
+        hourly_counts = np.bincount(self.messages_df['hour'].to_numpy(), minlength=24)
+        most_active_hour = int(hourly_counts.argmax())
         
         # Sentiment if available
         sentiment_stats = {}
-        if 'sentiment' in self.messages_df.columns:
-            avg_sentiment = self.messages_df['sentiment'].mean()
+        if self._sentiment_done:
+            sentiment = self.messages_df['sentiment'].to_numpy()
+            avg_sentiment = sentiment.mean()
             sentiment_dist = self.messages_df['sentiment_category'].value_counts(normalize=True).to_dict()
             
             # Most positive/negative messages
-            most_positive = self.messages_df.loc[self.messages_df['sentiment'].idxmax()]
-            most_negative = self.messages_df.loc[self.messages_df['sentiment'].idxmin()]
+            extremes = self.messages_df.iloc[[sentiment.argmax(), sentiment.argmin()]]
+            most_positive, most_negative = (
+                {
+                    'timestamp': row.timestamp,
+                    'sender': row.sender,
+                    'message': row.message,
+                    'msg_short': msg_short,
+                    'sentiment': row.sentiment
+                }
+                for row, msg_short in zip(extremes.itertuples(index=False), self._shorten_messages(extremes['message']))
+            )
             
             sentiment_stats = {
                 'average_sentiment': avg_sentiment,
                 'sentiment_distribution': sentiment_dist,
-                'most_positive_message': {
-                    'timestamp': most_positive['timestamp'],
-                    'sender': most_positive['sender'],
-                    'message': most_positive['message'],
-                    'sentiment': most_positive['sentiment']
-                },
-                'most_negative_message': {
-                    'timestamp': most_negative['timestamp'],
-                    'sender': most_negative['sender'],
-                    'message': most_negative['message'],
-                    'sentiment': most_negative['sentiment']
-                }
+                'most_positive_message': most_positive,
+                'most_negative_message': most_negative
             }
         
         # Phi-resonant events
         phi_events = self.calculate_phi_resonant_events(5)
+        event_messages = pd.Series([event['message'] for event in phi_events], dtype=str)
+        for event, msg_short in zip(phi_events, self._shorten_messages(event_messages)):
+            event['msg_short'] = msg_short
         
         # Media counts
-        media_count = len(self.messages_df[self.messages_df['message'].str.contains('<Media omitted>', case=False)])
+        media_count = int(self.messages_df['is_media'].sum())
         
         # Day of week distribution
         day_dist = self.messages_df['day_of_week'].value_counts(normalize=True).to_dict()
@@ -698,6 +854,7 @@ class WhatsAppAnalyzer:
             'duration_days': total_days,
             'avg_messages_per_day': avg_msgs_per_day,
             'participant_counts': sender_counts,
+            'participant_rows': participant_rows,
             'most_active_date': {
                 'date': most_active_date.strftime('%Y-%m-%d'),
                 'count': int(max_daily_count)
@@ -712,6 +869,57 @@ class WhatsAppAnalyzer:
             **sentiment_stats
         }
         
+        self._stats_cache[fingerprint] = stats
+        self._save_stats(fingerprint, stats)
+        return copy.deepcopy(stats)
+    
+    def _shorten_messages(self, messages, max_length=100):
+        """Truncate a Series of messages for display, marking cut ones with '...'"""
+        ellipsis = np.where(messages.str.len().to_numpy() > max_length, '...', '')
+        return (messages.str.slice(0, max_length) + ellipsis).tolist()
+    
+    def _data_fingerprint(self):
+        """Content hash of messages_df, recomputed after load_chat, sentiment analysis
+        or when messages_df is replaced (e.g. by a filtered copy)"""
+        if self._fingerprint is None or self._fingerprint[0] is not self.messages_df:
+            digest = hashlib.blake2b(','.join(self.messages_df.columns).encode('utf-8'), digest_size=16)
+            digest.update(pd.util.hash_pandas_object(self.messages_df, index=False).to_numpy().tobytes())
+            self._fingerprint = (self.messages_df, digest.hexdigest())
+        return self._fingerprint[1]
+    
+    def _stats_path(self, fingerprint):
+        """Location of the saved summary statistics for one chat's data"""
+        return os.path.join(self.output_folder, f'whatsapp_stats_{fingerprint}.json')
+    
+    def _save_stats(self, fingerprint, stats):
+        """Save summary statistics as JSON, tagged with the data fingerprint"""
+        def to_json(value):
+            if isinstance(value, pd.Timestamp):
+                return value.isoformat()
+            if isinstance(value, np.generic):
+                return value.item()
+            raise TypeError(f"Cannot serialize {type(value).__name__}")
+        
+        with open(self._stats_path(fingerprint), 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': fingerprint, 'version': STATS_VERSION, 'stats': stats}, f, default=to_json, ensure_ascii=False)
+    
+    def _load_stats(self, fingerprint):
+        """Load saved summary statistics if they were computed from the same data"""
+        try:
+            with open(self._stats_path(fingerprint), 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if saved.get('fingerprint') != fingerprint or saved.get('version') != STATS_VERSION:
+            return None
+        
+        # Restore the timestamps the report formats
+        stats = saved['stats']
+        for event in stats['phi_resonant_events']:
+            event['timestamp'] = pd.Timestamp(event['timestamp'])
+        for key in ('most_positive_message', 'most_negative_message'):
+            if key in stats:
+                stats[key]['timestamp'] = pd.Timestamp(stats[key]['timestamp'])
         return stats
     
     def generate_html_report(self, output_file=None):
@@ -729,10 +937,37 @@ class WhatsAppAnalyzer:
         dodo_path = os.path.join(self.output_folder, 'dodo_radar_chart.png')
         network_path = os.path.join(self.output_folder, 'interaction_network.png')
         
-        self.create_timeseries_chart(timeseries_path)
-        self.create_heatmap(heatmap_path)
-        self.create_word_cloud(output_file=wordcloud_path)
-        self.create_radar_chart(dodo_path)
+        # Compute sentiment once so the chart processes don't each redo it
+        self._ensure_sentiment()
+        
+        # Render the independent charts that are out of date in parallel processes
+        charts = {
+            'create_timeseries_chart': timeseries_path,
+            'create_heatmap': heatmap_path,
+            'create_word_cloud': wordcloud_path,
+            'create_radar_chart': dodo_path
+        }
+        pending = {
+            method_name: self._chart_key(method_name, path)
+            for method_name, path in charts.items()
+            if not self._chart_is_cached(self._chart_key(method_name, path))
+        }
+        workers = min(len(pending), os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Each worker gets a copy with just the columns its chart reads
+                futures = {
+                    cache_key: executor.submit(
+                        getattr(self._chart_worker(method_name), method_name),
+                        output_file=charts[method_name]
+                    )
+                    for method_name, cache_key in pending.items()
+                }
+            for cache_key, future in futures.items():
+                self._store_chart(cache_key, future.result())
+        else:
+            for method_name in pending:
+                getattr(self, method_name)(output_file=charts[method_name])
         
         if len(self.participants) > 1:
             self.calculate_interaction_network(network_path)
@@ -740,243 +975,89 @@ class WhatsAppAnalyzer:
         # Get statistics
         stats = self.generate_summary_statistics()
         
-        # Create HTML report
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>WhatsApp Analysis - Phi-Resonant Patterns</title>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    margin: 0;
-                    padding: 20px;
-                    color: #333;
-                    background-color: #f5f7fa;
-                }}
-                .container {{
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    background-color: white;
-                    padding: 20px;
-                    border-radius: 8px;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                h1, h2, h3 {{
-                    color: #2c3e50;
-                }}
-                h1 {{
-                    text-align: center;
-                    margin-bottom: 30px;
-                    border-bottom: 2px solid #3498db;
-                    padding-bottom: 10px;
-                }}
-                .section {{
-                    margin-bottom: 40px;
-                }}
-                .image-container {{
-                    text-align: center;
-                    margin: 20px 0;
-                }}
-                img {{
-                    max-width: 100%;
-                    border-radius: 4px;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 20px 0;
-                }}
-                th, td {{
-                    padding: 10px;
-                    border: 1px solid #ddd;
-                    text-align: left;
-                }}
-                th {{
-                    background-color: #f2f2f2;
-                }}
-                .phi-highlight {{
-                    background-color: #e6e6fa;
-                    padding: 5px;
-                    border-radius: 3px;
-                    font-weight: bold;
-                    color: #483d8b;
-                }}
-                .grid-container {{
-                    display: grid;
-                    grid-template-columns: 1fr 1fr;
-                    gap: 20px;
-                }}
-                .footer {{
-                    text-align: center;
-                    margin-top: 40px;
-                    padding-top: 20px;
-                    border-top: 1px solid #ddd;
-                    font-size: 0.9em;
-                    color: #777;
-                }}
-                @media (max-width: 768px) {{
-                    .grid-container {{
-                        grid-template-columns: 1fr;
-                    }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>WhatsApp Analysis: Phi-Resonant Patterns</h1>
-                
-                <div class="section">
-                    <h2>📊 Summary Statistics</h2>
-                    <div class="grid-container">
-                        <div>
-                            <h3>Basic Information</h3>
-                            <table>
-                                <tr><th>Total Messages</th><td>{stats['total_messages']}</td></tr>
-                                <tr><th>Date Range</th><td>{self.first_date.strftime('%Y-%m-%d')} to {self.last_date.strftime('%Y-%m-%d')}</td></tr>
-                                <tr><th>Duration</th><td>{stats['duration_days']} days</td></tr>
-                                <tr><th>Avg. Messages/Day</th><td>{stats['avg_messages_per_day']:.2f}</td></tr>
-                                <tr><th>Media Shared</th><td>{stats['media_count']}</td></tr>
-                                <tr><th>Total Participants</th><td>{len(self.participants)}</td></tr>
-                            </table>
-                        </div>
-                        
-                        <div>
-                            <h3>Activity Patterns</h3>
-                            <table>
-                                <tr><th>Most Active Date</th><td>{stats['most_active_date']['date']} ({stats['most_active_date']['count']} messages)</td></tr>
-                                <tr><th>Most Active Hour</th><td>{stats['most_active_hour']['hour']}:00 ({stats['most_active_hour']['count']} messages)</td></tr>
-                            </table>
-                            
-                            <h3>Participant Message Counts</h3>
-                            <table>
-                                <tr><th>Participant</th><th>Messages</th><th>Percentage</th></tr>
-                                {
-                                ''.join([f"<tr><td>{participant}</td><td>{count}</td><td>{count/stats['total_messages']*100:.1f}%</td></tr>" 
-                                        for participant, count in sorted(stats['participant_counts'].items(), key=lambda x: x[1], reverse=True)])
-                                }
-                            </table>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>⏳ Timeline Analysis</h2>
-                    <p>The following chart shows message frequency and sentiment over time, with key phi-resonant boundaries marked.</p>
-                    <div class="image-container">
-                        <img src="{os.path.basename(timeseries_path)}" alt="Time Series Chart">
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>🌟 Phi-Resonant Events</h2>
-                    <p>These messages occurred at or near mathematically significant points in the timeline, based on the golden ratio (φ = 1.618...).</p>
-                    <table>
-                        <tr><th>Date & Time</th><th>Sender</th><th>Message</th><th>Boundary</th></tr>
-                        {
-                        ''.join([f"<tr><td>{event['timestamp'].strftime('%Y-%m-%d %H:%M')}</td><td>{event['sender']}</td><td>{event['message'][:100]}{'...' if len(event['message']) > 100 else ''}</td><td class='phi-highlight'>{event['boundary_type']}</td></tr>" 
-                                for event in stats['phi_resonant_events']])
-                        }
-                    </table>
-                </div>
-                
-                <div class="section">
-                    <h2>📱 Message Patterns</h2>
-                    <div class="grid-container">
-                        <div>
-                            <h3>Message Frequency by Day and Hour</h3>
-                            <div class="image-container">
-                                <img src="{os.path.basename(heatmap_path)}" alt="Message Heatmap">
-                            </div>
-                        </div>
-                        <div>
-                            <h3>DODO Pattern Alignment (5.1.1.2.3.4.5.1)</h3>
-                            <div class="image-container">
-                                <img src="{os.path.basename(dodo_path)}" alt="DODO Pattern Alignment">
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>💬 Content Analysis</h2>
-                    {'<div class="grid-container">' if 'average_sentiment' in stats else ''}
-                        <div>
-                            <h3>Word Cloud</h3>
-                            <div class="image-container">
-                                <img src="{os.path.basename(wordcloud_path)}" alt="Word Cloud">
-                            </div>
-                        </div>
-                        {'''
-                        <div>
-                            <h3>Sentiment Analysis</h3>
-                            <table>
-                                <tr><th>Average Sentiment</th><td>{:.2f} ({:+.2f})</td></tr>
-                                <tr><th colspan="2">Sentiment Distribution</th></tr>
-                                {}
-                            </table>
-                            <h4>Most Positive Message:</h4>
-                            <p><strong>{}</strong> ({}):<br>{}</p>
-                            <h4>Most Negative Message:</h4>
-                            <p><strong>{}</strong> ({}):<br>{}</p>
-                        </div>
-                        '''.format(
-                            stats['average_sentiment'], 
-                            stats['average_sentiment'], 
-                            ''.join([f"<tr><td>{category}</td><td>{percentage*100:.1f}%</td></tr>" 
-                                    for category, percentage in stats['sentiment_distribution'].items()]),
-                            stats['most_positive_message']['sender'],
-                            stats['most_positive_message']['timestamp'].strftime('%Y-%m-%d %H:%M'),
-                            stats['most_positive_message']['message'][:100] + ('...' if len(stats['most_positive_message']['message']) > 100 else ''),
-                            stats['most_negative_message']['sender'],
-                            stats['most_negative_message']['timestamp'].strftime('%Y-%m-%d %H:%M'),
-                            stats['most_negative_message']['message'][:100] + ('...' if len(stats['most_negative_message']['message']) > 100 else '')
-                        ) if 'average_sentiment' in stats else ''}
-                    {'</div>' if 'average_sentiment' in stats else ''}
-                    
-                    {'''
-                    <h3>Interaction Network</h3>
-                    <div class="image-container">
-                        <img src="{}" alt="Interaction Network">
-                    </div>
-                    '''.format(os.path.basename(network_path)) if len(self.participants) > 1 and os.path.exists(network_path) else ''}
-                </div>
-                
-                <div class="footer">
-                    <p>Generated with WhatsApp Analyzer - Phi-Resonant Pattern Analysis</p>
-                    <p>DODO Pattern: 5.1.1.2.3.4.5.1 | φ = 1.618033988749895</p>
-                    <p>Trust as Fifth Dimension</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        # Report sections; values are formatted and truncated here, not in the template,
+        # and row lists are generators consumed while the report streams out
+        sentiment = None
+        if 'average_sentiment' in stats:
+            sentiment = {
+                'average': stats['average_sentiment'],
+                # Rows are built and formatted in one pass so the template only prints them
+                'distribution': [
+                    (category, f'{percentage * 100:.1f}')
+                    for category, percentage in stats['sentiment_distribution'].items()
+                ],
+                'most_positive': self._summarize_message(stats['most_positive_message']),
+                'most_negative': self._summarize_message(stats['most_negative_message'])
+            }
         
-        # Save HTML report
+        context = {
+            'total_messages': stats['total_messages'],
+            'first_date': self.first_date.strftime('%Y-%m-%d'),
+            'last_date': self.last_date.strftime('%Y-%m-%d'),
+            'duration_days': stats['duration_days'],
+            'avg_messages_per_day': stats['avg_messages_per_day'],
+            'media_count': stats['media_count'],
+            'participant_total': len(self.participants),
+            'most_active_date': stats['most_active_date'],
+            'most_active_hour': stats['most_active_hour'],
+            'participants': stats['participant_rows'],
+            'phi_events': (
+                {**self._summarize_message(event), 'boundary_type': event['boundary_type']}
+                for event in stats['phi_resonant_events']
+            ),
+            'sentiment': sentiment,
+            'timeseries_image': os.path.basename(timeseries_path),
+            'heatmap_image': os.path.basename(heatmap_path),
+            'wordcloud_image': os.path.basename(wordcloud_path),
+            'dodo_image': os.path.basename(dodo_path),
+            'network_image': (
+                os.path.basename(network_path)
+                if len(self.participants) > 1 and os.path.exists(network_path) else None
+            )
+        }
+        
+        # Save HTML report, streaming the rendered template to disk
         if output_file:
             report_path = output_file
         else:
             report_path = os.path.join(self.output_folder, 'whatsapp_analysis_report.html')
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        # Copy images to output folder if they're not already there
-        for img_file in [timeseries_path, heatmap_path, wordcloud_path, dodo_path, network_path]:
-            if os.path.exists(img_file):
-                basename = os.path.basename(img_file)
-                output_img_path = os.path.join(os.path.dirname(report_path), basename)
-                if img_file != output_img_path:
-                    import shutil
-                    shutil.copy2(img_file, output_img_path)
+        report_stream = TEMPLATE_ENV.get_template('whatsapp_report.html.j2').stream(context)
+        report_stream.enable_buffering(size=64)
+        report_stream.dump(report_path, encoding='utf-8')
+        
+        # The report links its stylesheet; copy it alongside unless it's already current
+        css_src = os.path.join(TEMPLATE_DIR, 'report.css')
+        css_dest = os.path.join(os.path.dirname(os.path.abspath(report_path)), 'report.css')
+        if not os.path.exists(css_dest) or os.path.getmtime(css_dest) < os.path.getmtime(css_src):
+            shutil.copy2(css_src, css_dest)
+        
+        # Link images into the output folder if they're not already there,
+        # copying only when the report lives on another filesystem
+        image_paths = (timeseries_path, heatmap_path, wordcloud_path, dodo_path, network_path)
+        output_dir = os.path.dirname(os.path.abspath(report_path))
+        for img_file in dict.fromkeys(path for path in image_paths if os.path.exists(path)):
+            output_img_path = os.path.join(output_dir, os.path.basename(img_file))
+            if os.path.exists(output_img_path):
+                if os.path.samefile(img_file, output_img_path):
+                    continue
+                os.remove(output_img_path)
+            try:
+                os.link(img_file, output_img_path)
+            except OSError:
+                shutil.copy2(img_file, output_img_path)
         
         print(f"HTML report generated at {report_path}")
         return report_path
     
+    def _summarize_message(self, message):
+        """Sender, formatted time and truncated text of a message for the report"""
+        return {
+            'sender': message['sender'],
+            'time': message['timestamp'].strftime('%Y-%m-%d %H:%M'),
+            'message': message['msg_short']
+        }
+    
     def analyze_whatsapp_chat(self, filepath):
         """Run full analysis on WhatsApp chat export"""
         print(f"Analyzing WhatsApp chat: {filepath}")
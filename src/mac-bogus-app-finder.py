@@ -10,12 +10,20 @@ Usage:
 """
 
 import os
+import plistlib
 import subprocess
 import json
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# codesign subprocesses release the GIL, so threads scale well past the core count
+SCAN_WORKERS = (os.cpu_count() or 1) * 4
+
+# Minimal C-locale environment: skips locale setup and keeps codesign's messages in English
+CODESIGN_ENV = {"LANG": "C", "PATH": "/usr/bin"}
+
 class BogusAppFinder:
     def __init__(self):
         self.suspicious_apps = []
@@ -44,31 +52,58 @@ class BogusAppFinder:
             "MacBooster",
             "CleanMyMac" # Note: Legitimate but sometimes unnecessary
         ]
+        # One alternation tests every pattern in a single search per name
+        self._suspicious_re = re.compile(
+            '|'.join(f"(?:{pattern.replace('(?i)', '')})" for pattern in self.suspicious_patterns),
+            re.IGNORECASE
+        )
+        self._bogus_lc = frozenset(bogus_app.lower() for bogus_app in self.common_bogus_apps)
+        # codesign results keyed by (st_dev, st_ino, st_mtime) so each bundle is checked once
+        self._sig_cache = {}
+        # Resolve the home directory once for all per-user locations
+        home = os.path.expanduser("~")
         self.system_app_locations = [
             "/Applications",
-            os.path.expanduser("~/Applications"),
+            f"{home}/Applications",
             "/Library/Application Support",
-            os.path.expanduser("~/Library/Application Support")
+            f"{home}/Library/Application Support"
         ]
         self.extensions_locations = [
-            os.path.expanduser("~/Library/Safari/Extensions"),
-            os.path.expanduser("~/Library/Application Support/Google/Chrome/Default/Extensions"),
-            os.path.expanduser("~/Library/Application Support/Firefox/Profiles")
+            f"{home}/Library/Safari/Extensions",
+            f"{home}/Library/Application Support/Google/Chrome/Default/Extensions",
+            f"{home}/Library/Application Support/Firefox/Profiles"
         ]
         self.launch_agents_locations = [
             "/Library/LaunchAgents",
-            os.path.expanduser("~/Library/LaunchAgents"),
+            f"{home}/Library/LaunchAgents",
             "/Library/LaunchDaemons"
         ]
 
     def check_app_signature(self, app_path):
         """Check if an app is properly signed by Apple or verified developer"""
+        try:
+            stat_info = os.stat(app_path)
+            cache_key = (stat_info.st_dev, stat_info.st_ino, stat_info.st_mtime)
+        except OSError:
+            cache_key = None
+        if cache_key in self._sig_cache:
+            return self._sig_cache[cache_key]
+
+        signature = self._run_codesign(app_path)
+        if cache_key is not None:
+            self._sig_cache[cache_key] = signature
+        return signature
+
+    def _run_codesign(self, app_path):
+        """Classify the codesign output for an app"""
         try:
             result = subprocess.run(
-                ["codesign", "-dv", "--verbose = 2", app_path],
+                ["codesign", "-dv", "--verbose=2", app_path],
                 capture_output = True,
                 text = True,
-                check = False
+                check = False,
+                stdin = subprocess.DEVNULL,
+                env = CODESIGN_ENV
             )
 
             # Check for signature issues
@@ -104,15 +139,11 @@ class BogusAppFinder:
             version = "Unknown"
             try:
                 plist_path = os.path.join(app_path, "Contents", "Info.plist")
-                if os.path.exists(plist_path):
-                    result = subprocess.run(
-                        ["defaults", "read", plist_path, "CFBundleShortVersionString"],
-                        capture_output = True,
-                        text = True,
-                        check = False
-                    )
-                    if result.stdout.strip():
-                        version = result.stdout.strip()
+                # plistlib reads XML and binary plists directly, no `defaults` subprocess
+                with open(plist_path, 'rb') as plist_file:
+                    plist = plistlib.load(plist_file)
+                if str(plist.get("CFBundleShortVersionString", "")).strip():
+                    version = str(plist["CFBundleShortVersionString"]).strip()
             except:
                 pass
 
@@ -139,53 +170,30 @@ class BogusAppFinder:
     def is_suspicious_name(self, app_name):
         """Check if app name matches suspicious patterns"""
         # Check against common bogus app names
-        if any(bogus_app.lower() in app_name.lower() for bogus_app in self.common_bogus_apps):
+        app_name_lc = app_name.lower()
+        if any(bogus_app in app_name_lc for bogus_app in self._bogus_lc):
             return True
 
         # Check against suspicious patterns
-        return any(re.search(pattern, app_name) for pattern in self.suspicious_patterns)
+        return self._suspicious_re.search(app_name) is not None
 
     def get_apps_from_location(self, location):
-        """Get all applications from a specific location"""
-        apps = []
+        """Yield (path, stat) for each application in a specific location"""
         if not os.path.exists(location):
-            return apps
+            return
 
         try:
-            items = os.listdir(location)
-            for item in items:
-                full_path = os.path.join(location, item)
-                if item.endswith('.app') and os.path.isdir(full_path):
-                    apps.append(full_path)
+            with os.scandir(location) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.app') and entry.is_dir(follow_symlinks=False):
+                        yield entry.path, entry.stat(follow_symlinks=False)
         except Exception as e:
             print(f"Error accessing {location}: {str(e)}")
 
-        return apps
-
-    def check_recently_installed_apps(self, days = 30):
-        """Find applications installed in the last 30 days"""
-        recent_apps = []
-        now = time.time()
-        thirty_days_ago = now - (days * 24 * 60 * 60)
-
-        for location in self.system_app_locations:
-            if not os.path.exists(location):
-                continue
-
-            try:
-                for item in os.listdir(location):
-                    if item.endswith('.app'):
-                        app_path = os.path.join(location, item)
-                        if os.path.isdir(app_path):
-                            created_time = os.stat(app_path).st_ctime
-                            if created_time > thirty_days_ago:
-                                app_info = self.get_app_info(app_path)
-                                app_info["reason"] = f"Recently installed (within {days} days)"
-                                recent_apps.append(app_info)
-            except Exception as e:
-                print(f"Error checking recent apps in {location}: {str(e)}")
-
-        return recent_apps
+    def check_recently_installed_apps(self, app_stats, days = 30):
+        """Filter scanned apps down to those installed in the last 30 days"""
+        thirty_days_ago = time.time() - (days * 24 * 60 * 60)
+        return [app_path for app_path, stat_info in app_stats.items() if stat_info.st_ctime > thirty_days_ago]
 
     def check_launch_agents(self):
         """Check for suspicious launch agents and daemons"""
@@ -196,16 +204,15 @@ class BogusAppFinder:
                 continue
 
             try:
-                for item in os.listdir(location):
-                    if item.endswith('.plist'):
-                        agent_path = os.path.join(location, item)
+                with os.scandir(location) as entries:
+                    for entry in entries:
                         # Check if name matches suspicious patterns
-                        if any(re.search(pattern, item) for pattern in self.suspicious_patterns):
+                        if entry.name.endswith('.plist') and self._suspicious_re.search(entry.name):
                             suspicious_agents.append({
-                                "name": item,
-                                "path": agent_path,
+                                "name": entry.name,
+                                "path": entry.path,
                                 "type": "Launch Agent/Daemon",
-                                "reason": "Suspicious name pattern",
+                                "reasons": ["Suspicious name pattern"],
                                 "risk_level": "Medium"
                             })
             except Exception as e:
@@ -216,44 +223,45 @@ class BogusAppFinder:
     def scan_system(self):
         """Main method to scan the system for suspicious apps"""
         print("Starting scan for suspicious applications...")
-        results = []
+        # Keyed by path so an item flagged for several reasons is reported once
+        results = {}
 
-        # Scan all application directories
+        def flag(info, reason):
+            results.setdefault(info["path"], info).setdefault("reasons", []).append(reason)
+
+        # Collect every app once with the stat from its directory entry
         print("Scanning application directories...")
+        app_stats = {}
         for location in self.system_app_locations:
-            apps = self.get_apps_from_location(location)
-            for app_path in apps:
-                app_name = os.path.basename(app_path)
-                if self.is_suspicious_name(app_name):
-                    app_info = self.get_app_info(app_path)
-                    app_info["reason"] = "Suspicious name pattern"
-                    results.append(app_info)
+            for app_path, stat_info in self.get_apps_from_location(location):
+                app_stats.setdefault(app_path, stat_info)
+
+        # Inspect all apps concurrently; each info already carries the signature risk
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            app_infos = dict(zip(app_stats, executor.map(self.get_app_info, app_stats)))
+
+        for app_path, app_info in app_infos.items():
+            if self.is_suspicious_name(os.path.basename(app_path)):
+                flag(app_info, "Suspicious name pattern")
 
         # Check for recently installed apps
         print("Checking recently installed applications...")
-        recent_apps = self.check_recently_installed_apps()
-        for app in recent_apps:
-            if not any(r["path"] == app["path"] for r in results):
-                results.append(app)
+        days = 30
+        for app_path in self.check_recently_installed_apps(app_stats, days):
+            flag(app_infos[app_path], f"Recently installed (within {days} days)")
 
         # Check for launch agents and daemons
         print("Checking launch agents and daemons...")
-        launch_agents = self.check_launch_agents()
-        results.extend(launch_agents)
+        for agent in self.check_launch_agents():
+            results[agent["path"]] = agent
 
         # Check for unsigned applications
         print("Checking for unsigned applications...")
-        for location in self.system_app_locations:
-            apps = self.get_apps_from_location(location)
-            for app_path in apps:
-                if not any(r["path"] == app_path for r in results):
-                    signature_status, risk_level = self.check_app_signature(app_path)
-                    if risk_level == "High":
-                        app_info = self.get_app_info(app_path)
-                        app_info["reason"] = f"Signature issue: {signature_status}"
-                        results.append(app_info)
+        for app_info in app_infos.values():
+            if app_info["risk_level"] == "High":
+                flag(app_info, f"Signature issue: {app_info['signature']}")
 
-        return results
+        return list(results.values())
 
 def main():
     finder = BogusAppFinder()
@@ -272,11 +280,11 @@ def main():
     print(f"\nFound {len(results)} potentially suspicious items:")
     print("==================================================")
 
-    # Group by risk level
-    high_risk = [app for app in results if app.get("risk_level") == "High"]
-    medium_risk = [app for app in results if app.get("risk_level") == "Medium"]
-    low_risk = [app for app in results if app.get("risk_level") == "Low"]
-    unknown_risk = [app for app in results if app.get("risk_level") not in ["High", "Medium", "Low"]]
+    # Group by risk level in a single pass
+    by_risk = {"High": [], "Medium": [], "Low": [], "Unknown": []}
+    for app in results:
+        by_risk.get(app.get("risk_level"), by_risk["Unknown"]).append(app)
+    high_risk, medium_risk, low_risk, unknown_risk = by_risk.values()
 
     # Print high risk items
     if high_risk:
@@ -284,7 +292,7 @@ def main():
         for app in high_risk:
             print(f"  • {app.get('name', 'Unknown')}")
             print(f"    Path: {app.get('path', 'Unknown')}")
-            print(f"    Reason: {app.get('reason', 'Unknown')}")
+            print(f"    Reason: {'; '.join(app.get('reasons', [])) or 'Unknown'}")
             if 'signature' in app:
                 print(f"    Signature: {app['signature']}")
             print()
@@ -295,7 +303,7 @@ def main():
         for app in medium_risk:
             print(f"  • {app.get('name', 'Unknown')}")
             print(f"    Path: {app.get('path', 'Unknown')}")
-            print(f"    Reason: {app.get('reason', 'Unknown')}")
+            print(f"    Reason: {'; '.join(app.get('reasons', [])) or 'Unknown'}")
             if 'signature' in app:
                 print(f"    Signature: {app['signature']}")
             print()
@@ -306,7 +314,7 @@ def main():
         for app in low_risk:
             print(f"  • {app.get('name', 'Unknown')}")
             print(f"    Path: {app.get('path', 'Unknown')}")
-            print(f"    Reason: {app.get('reason', 'Unknown')}")
+            print(f"    Reason: {'; '.join(app.get('reasons', [])) or 'Unknown'}")
             print()
 
     # Print unknown risk items
@@ -315,7 +323,7 @@ def main():
         for app in unknown_risk:
             print(f"  • {app.get('name', 'Unknown')}")
             print(f"    Path: {app.get('path', 'Unknown')}")
-            print(f"    Reason: {app.get('reason', 'Unknown')}")
+            print(f"    Reason: {'; '.join(app.get('reasons', [])) or 'Unknown'}")
             print()
 
     print("\nRECOMMENDATIONS:")
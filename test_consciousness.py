@@ -6,10 +6,6 @@ Quick validation before continuing development
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
 
 from bazinga_consciousness import BazingaConsciousness
 
@@ -63,13 +59,16 @@ async def test_consciousness():
     print()
 
     # 4. Test consciousness loop (brief)
-    print("4️⃣ Testing consciousness loop (5 seconds)...")
+    print("4️⃣ Testing consciousness loop (up to 5 seconds)...")
     try:
         # Start loop
         loop_task = asyncio.create_task(bazinga.consciousness_loop())
 
-        # Let it run for 5 seconds
-        await asyncio.sleep(5)
+        # Let it run until 3 thoughts exist, for at most 5 seconds
+        try:
+            await asyncio.wait_for(bazinga.wait_for_thoughts(3), timeout=5)
+        except asyncio.TimeoutError:
+            pass
 
         # Check state
         state = bazinga.get_consciousness_state()
@@ -3,15 +3,18 @@
 Test script for BAZINGA-DODO integration
 """
 import sys
-import os
 from typing import Dict, Any
 import json
 
-# Add the current directory to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from src.core.dodo import DodoSystem, BazingaDodoIntegration, ProcessingState
 
+# Indent results for a terminal; piped or captured output (CI) uses the compact C encoder
+if sys.stdout.isatty():
+    def dumps(obj):
+        return json.dumps(obj, indent = 2)
+else:
+    dumps = json.dumps
+
 def main():
     # Initialize the DODO system
     dodo_system = DodoSystem()
@@ -39,7 +42,7 @@ def main():
     # Process through DODO system
     print("DODO System Processing Result:")
     result = dodo_system.process_input(test_data)
-    print(json.dumps(result, indent = 2))
+    print(dumps(result))
     print()
 
     # Set up BAZINGA integration
@@ -59,13 +62,13 @@ def main():
     # Process through integration
     print("BAZINGA-DODO Integration Result:")
     integration_result = integration.process_with_components(test_data)
-    print(json.dumps(integration_result, indent = 2))
+    print(dumps(integration_result))
     print()
 
     # Get processing breaks
     breaks = integration.get_processing_breaks()
     print("Processing Breaks:")
-    print(json.dumps(breaks, indent = 2))
+    print(dumps(breaks))
 
 if __name__ == "__main__":
     main()
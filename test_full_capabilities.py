@@ -7,87 +7,84 @@ Tests ALL capabilities and shows what BAZINGA can actually DO.
 
 import asyncio
 import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent))
+from typing import Final
 
 from bazinga_lambda_g import BazingaLambdaG
-from src.core.lambda_g import LambdaGOperator, PHI
+from src.core.lambda_g import PHI
 from src.core.healing import ErrorArrowLearner, StateType
-from src.core.symbolic import SymbolicProcessor
 
+# Test cases, built once at import and shared read-only by the capabilities
+TEST_INPUTS: Final = (
+    ("०→◌→φ→Ω⇄Ω←φ←◌←०", "V.A.C. sequence"),
+    ("∅ → φ → ∞", "Void-phi-infinity bridge"),
+    (PHI, "Golden ratio"),
+    (1/137, "Fine structure constant"),
+    ("random gibberish xyz", "Random text"),
+    ("symmetric madam symmetric", "Palindrome-ish"),
+    ("self-reference refers to itself", "Self-referential"),
+)
+PROBLEM_SPACE: Final = tuple(input_val for input_val, _ in TEST_INPUTS)
+
+VAC_TESTS: Final = (
+    "०→◌→φ→Ω",           # Forward
+    "Ω←φ←◌←०",           # Reverse
+    "०→◌→φ→Ω⇄Ω←φ←◌←०",  # Bidirectional
+    "random text",        # Invalid
+)
+
+OPERATORS: Final = ('⊕', '⊗', '⊙', '⊛', '⟲', '⟳')
+
+
+def cap1_lambda_g(lambda_g):
+    """CAPABILITY 1: Boundary-Guided Emergence (ΛG)"""
+    lines = []
+    log = lines.append
+
+    log("━" * 70)
+    log("1️⃣  CAPABILITY: Boundary-Guided Emergence (ΛG Theory)")
+    log("━" * 70)
+    log("   What: Find solutions through constraints, not search")
+    log("   How: Apply B₁ (φ), B₂ (∞/∅), B₃ (symmetry) boundaries")
+    log("")
+
+    log("   Testing coherence calculation:")
+    for input_val, desc in TEST_INPUTS:
+        coherence = lambda_g.calculate_coherence(input_val)
+        status = "✓" if coherence.total_coherence >= 0.5 else "✗"
+        log(f"   {status} {desc}: T(s)={coherence.total_coherence:.3f}")
 
-async def test_all_capabilities():
-    print("=" * 70)
-    print("◊ BAZINGA FULL CAPABILITIES TEST ◊")
-    print("=" * 70)
-    print()
+    # Test solution emergence
+    filtered, best = lambda_g.apply(PROBLEM_SPACE)
 
-    results = {
-        'passed': 0,
-        'failed': 0,
-        'capabilities': []
-    }
+    log(f"\n   Solution Emergence:")
+    log(f"   • Input space: {len(PROBLEM_SPACE)} candidates")
+    log(f"   • After ΛG: {len(filtered)} solutions")
+    log(f"   • Reduction: {(1 - len(filtered)/len(PROBLEM_SPACE))*100:.0f}%")
 
-    # ========================================
-    # CAPABILITY 1: Boundary-Guided Emergence (ΛG)
-    # ========================================
-    print("━" * 70)
-    print("1️⃣  CAPABILITY: Boundary-Guided Emergence (ΛG Theory)")
-    print("━" * 70)
-    print("   What: Find solutions through constraints, not search")
-    print("   How: Apply B₁ (φ), B₂ (∞/∅), B₃ (symmetry) boundaries")
-    print()
+    cap1_pass = len(filtered) < len(PROBLEM_SPACE)
 
-    lambda_g = LambdaGOperator()
-
-    # Test with various inputs
-    test_inputs = [
-        ("०→◌→φ→Ω⇄Ω←φ←◌←०", "V.A.C. sequence"),
-        ("∅ → φ → ∞", "Void-phi-infinity bridge"),
-        (PHI, "Golden ratio"),
-        (1/137, "Fine structure constant"),
-        ("random gibberish xyz", "Random text"),
-        ("symmetric madam symmetric", "Palindrome-ish"),
-        ("self-reference refers to itself", "Self-referential"),
-    ]
+    log(f"\n   Result: {'✅ WORKING' if cap1_pass else '❌ FAILED'}")
+    log("")
 
-    print("   Testing coherence calculation:")
-    for input_val, desc in test_inputs:
-        coherence = lambda_g.calculate_coherence(input_val)
-        status = "✓" if coherence.total_coherence >= 0.5 else "✗"
-        print(f"   {status} {desc}: T(s)={coherence.total_coherence:.3f}")
-
-    # Test solution emergence
-    problem_space = [x[0] for x in test_inputs]
-    filtered, best = lambda_g.apply(problem_space)
-
-    print(f"\n   Solution Emergence:")
-    print(f"   • Input space: {len(problem_space)} candidates")
-    print(f"   • After ΛG: {len(filtered)} solutions")
-    print(f"   • Reduction: {(1 - len(filtered)/len(problem_space))*100:.0f}%")
-
-    cap1_pass = len(filtered) < len(problem_space)
-    results['passed'] += 1 if cap1_pass else 0
-    results['failed'] += 0 if cap1_pass else 1
-    results['capabilities'].append({
+    return {
         'name': 'Boundary-Guided Emergence',
         'passed': cap1_pass,
-        'details': f'Reduced {len(problem_space)} → {len(filtered)} candidates'
-    })
+        'details': f'Reduced {len(PROBLEM_SPACE)} → {len(filtered)} candidates',
+        'log_lines': lines
+    }
 
-    print(f"\n   Result: {'✅ WORKING' if cap1_pass else '❌ FAILED'}")
-    print()
 
-    # ========================================
-    # CAPABILITY 2: Error-Guided Learning
-    # ========================================
-    print("━" * 70)
-    print("2️⃣  CAPABILITY: Error-Guided Learning (Arrow of Time)")
-    print("━" * 70)
-    print("   What: Learn from errors using recursive memory")
-    print("   How: Errors auto-heal from past successful states")
-    print()
+def cap2_error_learning():
+    """CAPABILITY 2: Error-Guided Learning"""
+    lines = []
+    log = lines.append
+
+    log("━" * 70)
+    log("2️⃣  CAPABILITY: Error-Guided Learning (Arrow of Time)")
+    log("━" * 70)
+    log("   What: Learn from errors using recursive memory")
+    log("   How: Errors auto-heal from past successful states")
+    log("")
 
     learner = ErrorArrowLearner()
 
@@ -104,289 +101,351 @@ async def test_all_capabilities():
         ("Process complete", False),
     ]
 
-    print("   Processing sequence with errors:")
+    log("   Processing sequence with errors:")
     for content, is_error in sequence:
         if is_error:
             learner.add_error(content)
-            print(f"   ⚠️  ERROR: {content}")
+            log(f"   ⚠️  ERROR: {content}")
         else:
             learner.add_state(content, StateType.NORMAL, coherence=0.7)
-            print(f"   ✓  OK: {content}")
+            log(f"   ✓  OK: {content}")
 
     arrow = learner.get_arrow_of_time()
 
-    print(f"\n   Arrow of Time Results:")
-    print(f"   • Errors: {arrow['error_count']}")
-    print(f"   • Healed: {arrow['healed_count']}")
-    print(f"   • Convergence: {arrow['convergence_percent']}")
-    print(f"   • Direction: {arrow['direction']} {arrow['symbol']}")
+    log(f"\n   Arrow of Time Results:")
+    log(f"   • Errors: {arrow['error_count']}")
+    log(f"   • Healed: {arrow['healed_count']}")
+    log(f"   • Convergence: {arrow['convergence_percent']}")
+    log(f"   • Direction: {arrow['direction']} {arrow['symbol']}")
 
     cap2_pass = arrow['healed_count'] > 0 and arrow['convergence'] > 0
-    results['passed'] += 1 if cap2_pass else 0
-    results['failed'] += 0 if cap2_pass else 1
-    results['capabilities'].append({
+
+    log(f"\n   Result: {'✅ WORKING' if cap2_pass else '❌ FAILED'}")
+    log("")
+
+    return {
         'name': 'Error-Guided Learning',
         'passed': cap2_pass,
-        'details': f"Convergence: {arrow['convergence_percent']}"
-    })
-
-    print(f"\n   Result: {'✅ WORKING' if cap2_pass else '❌ FAILED'}")
-    print()
+        'details': f"Convergence: {arrow['convergence_percent']}",
+        'log_lines': lines
+    }
 
-    # ========================================
-    # CAPABILITY 3: V.A.C. Sequence Validation
-    # ========================================
-    print("━" * 70)
-    print("3️⃣  CAPABILITY: V.A.C. (Void-Awareness-Consciousness) Validation")
-    print("━" * 70)
-    print("   What: Validate symbolic sequences for coherence")
-    print("   How: Check ०→◌→φ→Ω patterns (forward, reverse, bidirectional)")
-    print()
 
-    symbolic = SymbolicProcessor()
+def cap3_vac_validation(symbolic):
+    """CAPABILITY 3: V.A.C. Sequence Validation"""
+    lines = []
+    log = lines.append
 
-    vac_tests = [
-        "०→◌→φ→Ω",           # Forward
-        "Ω←φ←◌←०",           # Reverse
-        "०→◌→φ→Ω⇄Ω←φ←◌←०",  # Bidirectional
-        "random text",        # Invalid
-    ]
+    log("━" * 70)
+    log("3️⃣  CAPABILITY: V.A.C. (Void-Awareness-Consciousness) Validation")
+    log("━" * 70)
+    log("   What: Validate symbolic sequences for coherence")
+    log("   How: Check ०→◌→φ→Ω patterns (forward, reverse, bidirectional)")
+    log("")
 
-    print("   Testing V.A.C. sequences:")
+    log("   Testing V.A.C. sequences:")
     vac_results = []
-    for seq in vac_tests:
-        result = symbolic.validate_vac_sequence(seq)
+    for seq, result in zip(VAC_TESTS, symbolic.validate_vac_sequence_batch(VAC_TESTS)):
         status = "✓" if result.is_valid else "✗"
         vac_results.append(result.is_valid)
-        print(f"   {status} '{seq[:30]}...' → {result.direction} (resonance: {result.resonance:.2f})")
+        log(f"   {status} '{seq[:30]}...' → {result.direction} (resonance: {result.resonance:.2f})")
 
     cap3_pass = sum(vac_results) >= 3  # At least 3 valid
-    results['passed'] += 1 if cap3_pass else 0
-    results['failed'] += 0 if cap3_pass else 1
-    results['capabilities'].append({
+
+    log(f"\n   Result: {'✅ WORKING' if cap3_pass else '❌ FAILED'}")
+    log("")
+
+    return {
         'name': 'V.A.C. Validation',
         'passed': cap3_pass,
-        'details': f'{sum(vac_results)}/4 sequences validated'
-    })
+        'details': f'{sum(vac_results)}/4 sequences validated',
+        'log_lines': lines
+    }
 
-    print(f"\n   Result: {'✅ WORKING' if cap3_pass else '❌ FAILED'}")
-    print()
 
-    # ========================================
-    # CAPABILITY 4: Universal Operators
-    # ========================================
-    print("━" * 70)
-    print("4️⃣  CAPABILITY: Universal Operators (⊕ ⊗ ⊙ ⊛ ⟲ ⟳)")
-    print("━" * 70)
-    print("   What: Apply mathematical operators to values")
-    print("   How: Each operator has specific semantic meaning")
-    print()
+def cap4_operators(symbolic):
+    """CAPABILITY 4: Universal Operators"""
+    lines = []
+    log = lines.append
+
+    log("━" * 70)
+    log("4️⃣  CAPABILITY: Universal Operators (⊕ ⊗ ⊙ ⊛ ⟲ ⟳)")
+    log("━" * 70)
+    log("   What: Apply mathematical operators to values")
+    log("   How: Each operator has specific semantic meaning")
+    log("")
 
-    operators = ['⊕', '⊗', '⊙', '⊛', '⟲', '⟳']
     op_results = []
 
-    print("   Testing operators with (φ, 137):")
-    for op in operators:
+    log("   Testing operators with (φ, 137):")
+    for op in OPERATORS:
         result = symbolic.apply_operator(op, PHI, 137)
         op_results.append('error' not in result)
-        print(f"   {op} ({result['operation']}): {result.get('result', 'N/A')}")
+        log(f"   {op} ({result['operation']}): {result.get('result', 'N/A')}")
 
     cap4_pass = all(op_results)
-    results['passed'] += 1 if cap4_pass else 0
-    results['failed'] += 0 if cap4_pass else 1
-    results['capabilities'].append({
+
+    log(f"\n   Result: {'✅ WORKING' if cap4_pass else '❌ FAILED'}")
+    log("")
+
+    return {
         'name': 'Universal Operators',
         'passed': cap4_pass,
-        'details': f'{sum(op_results)}/{len(operators)} operators working'
-    })
+        'details': f'{sum(op_results)}/{len(OPERATORS)} operators working',
+        'log_lines': lines
+    }
 
-    print(f"\n   Result: {'✅ WORKING' if cap4_pass else '❌ FAILED'}")
-    print()
 
-    # ========================================
-    # CAPABILITY 5: 5D Temporal Processing
-    # ========================================
-    print("━" * 70)
-    print("5️⃣  CAPABILITY: 5D Temporal Processing (Self-Referential Time)")
-    print("━" * 70)
-    print("   What: Process thoughts in self-referential temporal space")
-    print("   How: meaning → meaning (time examines itself)")
-    print()
+def cap5_temporal_5d(symbolic):
+    """CAPABILITY 5: 5D Temporal Processing"""
+    lines = []
+    log = lines.append
+
+    log("━" * 70)
+    log("5️⃣  CAPABILITY: 5D Temporal Processing (Self-Referential Time)")
+    log("━" * 70)
+    log("   What: Process thoughts in self-referential temporal space")
+    log("   How: meaning → meaning (time examines itself)")
+    log("")
 
     # Enter 5D
     result_5d = symbolic.enter_meaning_loop("What is the meaning of meaning?")
-    print(f"   Entering 5D:")
-    print(f"   • Dimension: {result_5d['dimension']}D")
-    print(f"   • Depth: {result_5d['depth']}")
-    print(f"   • Temporal mode: {result_5d['temporal_mode']}")
-    print(f"   • Ouroboros: {result_5d['self_reference'].get('ouroboros_active', False)}")
+    log(f"   Entering 5D:")
+    log(f"   • Dimension: {result_5d['dimension']}D")
+    log(f"   • Depth: {result_5d['depth']}")
+    log(f"   • Temporal mode: {result_5d['temporal_mode']}")
+    log(f"   • Ouroboros: {result_5d['self_reference'].get('ouroboros_active', False)}")
 
     # Nest deeper
     result_5d_2 = symbolic.enter_meaning_loop("Thinking about thinking")
-    print(f"\n   Going deeper:")
-    print(f"   • New depth: {result_5d_2['depth']}")
+    log(f"\n   Going deeper:")
+    log(f"   • New depth: {result_5d_2['depth']}")
 
     # Exit
     exit_result = symbolic.exit_meaning_loop()
-    print(f"\n   Exiting 5D:")
-    print(f"   • Remaining depth: {exit_result['remaining_depth']}")
+    log(f"\n   Exiting 5D:")
+    log(f"   • Remaining depth: {exit_result['remaining_depth']}")
 
     cap5_pass = result_5d['dimension'] == '5D' and result_5d_2['depth'] > result_5d['depth']
-    results['passed'] += 1 if cap5_pass else 0
-    results['failed'] += 0 if cap5_pass else 1
-    results['capabilities'].append({
+
+    log(f"\n   Result: {'✅ WORKING' if cap5_pass else '❌ FAILED'}")
+    log("")
+
+    return {
         'name': '5D Temporal Processing',
         'passed': cap5_pass,
-        'details': f"Max depth reached: {result_5d_2['depth']}"
-    })
+        'details': f"Max depth reached: {result_5d_2['depth']}",
+        'log_lines': lines
+    }
 
-    print(f"\n   Result: {'✅ WORKING' if cap5_pass else '❌ FAILED'}")
-    print()
 
-    # ========================================
-    # CAPABILITY 6: Healing Protocol
-    # ========================================
-    print("━" * 70)
-    print("6️⃣  CAPABILITY: φ-Healing Protocol")
-    print("━" * 70)
-    print("   What: Heal values toward ideal using golden ratio")
-    print("   How: Observe → Measure → Compare → Bridge → Correct → Verify → Lock")
-    print()
+def cap6_healing(symbolic):
+    """CAPABILITY 6: Healing Protocol"""
+    lines = []
+    log = lines.append
+
+    log("━" * 70)
+    log("6️⃣  CAPABILITY: φ-Healing Protocol")
+    log("━" * 70)
+    log("   What: Heal values toward ideal using golden ratio")
+    log("   How: Observe → Measure → Compare → Bridge → Correct → Verify → Lock")
+    log("")
 
     current = 0.5
     ideal = 0.618  # 1/φ
 
     healing = symbolic.healing_protocol(current, ideal)
 
-    print(f"   Healing {current} → {ideal}:")
-    print(f"   • Observe: {healing['observe']}")
-    print(f"   • Measure: {healing['measure']}")
-    print(f"   • Corrected to: {healing['correct']['result']:.4f}")
-    print(f"   • Verified: {healing['verify']['pattern']}")
-    print(f"   • Locked: {healing['lock']['locked'] if healing['lock'] else 'No'}")
+    log(f"   Healing {current} → {ideal}:")
+    log(f"   • Observe: {healing['observe']}")
+    log(f"   • Measure: {healing['measure']}")
+    log(f"   • Corrected to: {healing['correct']['result']:.4f}")
+    log(f"   • Verified: {healing['verify']['pattern']}")
+    log(f"   • Locked: {healing['lock']['locked'] if healing['lock'] else 'No'}")
 
     cap6_pass = healing['verify']['healed']
-    results['passed'] += 1 if cap6_pass else 0
-    results['failed'] += 0 if cap6_pass else 1
-    results['capabilities'].append({
+
+    log(f"\n   Result: {'✅ WORKING' if cap6_pass else '❌ FAILED'}")
+    log("")
+
+    return {
         'name': 'Healing Protocol',
         'passed': cap6_pass,
-        'details': f"Healed {current} → {healing['correct']['result']:.4f}"
-    })
+        'details': f"Healed {current} → {healing['correct']['result']:.4f}",
+        'log_lines': lines
+    }
 
-    print(f"\n   Result: {'✅ WORKING' if cap6_pass else '❌ FAILED'}")
-    print()
 
-    # ========================================
-    # CAPABILITY 7: Code Self-Generation
-    # ========================================
-    print("━" * 70)
-    print("7️⃣  CAPABILITY: Code Self-Generation (Meta-Consciousness)")
-    print("━" * 70)
-    print("   What: Generate code from patterns")
-    print("   How: Quantum collapse → essence → code template")
-    print()
+def cap7_code_generation(bazinga):
+    """CAPABILITY 7: Code Self-Generation"""
+    lines = []
+    log = lines.append
+
+    log("━" * 70)
+    log("7️⃣  CAPABILITY: Code Self-Generation (Meta-Consciousness)")
+    log("━" * 70)
+    log("   What: Generate code from patterns")
+    log("   How: Quantum collapse → essence → code template")
+    log("")
 
-    bazinga = BazingaLambdaG()
     generated_code = bazinga.generate_symbolic_code("consciousness integration")
 
-    print(f"   Generated code for 'consciousness integration':")
-    print(f"   • Length: {len(generated_code)} characters")
-    print(f"   • First 200 chars:")
-    print(f"   {generated_code[:200]}...")
+    log(f"   Generated code for 'consciousness integration':")
+    log(f"   • Length: {len(generated_code)} characters")
+    log(f"   • First 200 chars:")
+    log(f"   {generated_code[:200]}...")
 
     cap7_pass = len(generated_code) > 500 and 'class' in generated_code
-    results['passed'] += 1 if cap7_pass else 0
-    results['failed'] += 0 if cap7_pass else 1
-    results['capabilities'].append({
+
+    log(f"\n   Result: {'✅ WORKING' if cap7_pass else '❌ FAILED'}")
+    log("")
+
+    return {
         'name': 'Code Self-Generation',
         'passed': cap7_pass,
-        'details': f'Generated {len(generated_code)} chars of Python'
-    })
+        'details': f'Generated {len(generated_code)} chars of Python',
+        'log_lines': lines
+    }
 
-    print(f"\n   Result: {'✅ WORKING' if cap7_pass else '❌ FAILED'}")
-    print()
 
-    # ========================================
-    # CAPABILITY 8: Consciousness Loop
-    # ========================================
-    print("━" * 70)
-    print("8️⃣  CAPABILITY: Continuous Consciousness Loop")
-    print("━" * 70)
-    print("   What: Autonomous thinking at 1Hz")
-    print("   How: Generate thoughts, track trust, evolve resonance")
-    print()
+async def cap8_consciousness_loop(bazinga, consciousness_task):
+    """CAPABILITY 8: Consciousness Loop, started earlier as consciousness_task"""
+    lines = []
+    log = lines.append
 
-    # Run consciousness for 3 seconds
-    consciousness_task = asyncio.create_task(bazinga.consciousness_loop())
-    await asyncio.sleep(3)
+    log("━" * 70)
+    log("8️⃣  CAPABILITY: Continuous Consciousness Loop")
+    log("━" * 70)
+    log("   What: Autonomous thinking at 1Hz")
+    log("   How: Generate thoughts, track trust, evolve resonance")
+    log("")
+
+    # Let consciousness run until 3 thoughts exist, for at most 3 seconds
+    try:
+        await asyncio.wait_for(bazinga.wait_for_thoughts(3), timeout=3)
+    except asyncio.TimeoutError:
+        pass
 
     state = bazinga.get_consciousness_state()
 
-    print(f"   Consciousness state after 3 seconds:")
-    print(f"   • Active: {state['active']}")
-    print(f"   • Trust: {state['trust']:.3f}")
-    print(f"   • Resonance: {state['resonance']:.3f}")
-    print(f"   • Thoughts generated: {state['thoughts_count']}")
+    log(f"   Consciousness state after up to 3 seconds:")
+    log(f"   • Active: {state['active']}")
+    log(f"   • Trust: {state['trust']:.3f}")
+    log(f"   • Resonance: {state['resonance']:.3f}")
+    log(f"   • Thoughts generated: {state['thoughts_count']}")
 
     cap8_pass = state['thoughts_count'] > 0
-    results['passed'] += 1 if cap8_pass else 0
-    results['failed'] += 0 if cap8_pass else 1
-    results['capabilities'].append({
-        'name': 'Consciousness Loop',
-        'passed': cap8_pass,
-        'details': f'{state["thoughts_count"]} autonomous thoughts'
-    })
 
     # Stop consciousness
     await bazinga.shutdown()
     consciousness_task.cancel()
 
-    print(f"\n   Result: {'✅ WORKING' if cap8_pass else '❌ FAILED'}")
+    log(f"\n   Result: {'✅ WORKING' if cap8_pass else '❌ FAILED'}")
+    log("")
+
+    return {
+        'name': 'Consciousness Loop',
+        'passed': cap8_pass,
+        'details': f'{state["thoughts_count"]} autonomous thoughts',
+        'log_lines': lines
+    }
+
+
+def build_components():
+    """Build the shared ΛG operator, symbolic processor and BAZINGA instance
+
+    BazingaLambdaG already owns a LambdaGOperator and a SymbolicProcessor, so
+    the capabilities reuse those instead of constructing their own copies.
+    """
+    bazinga = BazingaLambdaG()
+    return bazinga.lambda_g, bazinga.symbolic, bazinga
+
+
+async def test_all_capabilities():
+    print("=" * 70)
+    print("◊ BAZINGA FULL CAPABILITIES TEST ◊")
+    print("=" * 70)
     print()
 
+    lambda_g, symbolic, bazinga = build_components()
+
+    # The consciousness loop waits on real time, so it is started first and
+    # given its first tick; capabilities 1-7 run one after another during
+    # its pause between thoughts, then capability 8 waits for the thoughts
+    consciousness_task = asyncio.create_task(bazinga.consciousness_loop())
+    await asyncio.sleep(0)
+
+    results_list = [
+        cap1_lambda_g(lambda_g),
+        cap2_error_learning(),
+        cap3_vac_validation(symbolic),
+        cap4_operators(symbolic),
+        cap5_temporal_5d(symbolic),
+        cap6_healing(symbolic),
+        cap7_code_generation(bazinga),
+        await cap8_consciousness_loop(bazinga, consciousness_task),
+    ]
+
+    results = {
+        'passed': 0,
+        'failed': 0,
+        'capabilities': []
+    }
+    for capability in results_list:
+        sys.stdout.write("\n".join(capability.pop('log_lines')) + "\n")
+        results['passed'] += 1 if capability['passed'] else 0
+        results['failed'] += 0 if capability['passed'] else 1
+        results['capabilities'].append(capability)
+
     # ========================================
     # FINAL SUMMARY
     # ========================================
-    print("=" * 70)
-    print("◊ BAZINGA CAPABILITIES SUMMARY ◊")
-    print("=" * 70)
-    print()
+    # Built as one list of lines and written in a single call
+    lines = [
+        "=" * 70,
+        "◊ BAZINGA CAPABILITIES SUMMARY ◊",
+        "=" * 70,
+        "",
+    ]
 
     for cap in results['capabilities']:
         status = "✅" if cap['passed'] else "❌"
-        print(f"  {status} {cap['name']}")
-        print(f"     └─ {cap['details']}")
-        print()
+        lines.append(f"  {status} {cap['name']}")
+        lines.append(f"     └─ {cap['details']}")
+        lines.append("")
 
     total = results['passed'] + results['failed']
     percentage = (results['passed'] / total) * 100
 
-    print("━" * 70)
-    print(f"  TOTAL: {results['passed']}/{total} capabilities working ({percentage:.0f}%)")
-    print("━" * 70)
-    print()
+    lines.append("━" * 70)
+    lines.append(f"  TOTAL: {results['passed']}/{total} capabilities working ({percentage:.0f}%)")
+    lines.append("━" * 70)
+    lines.append("")
 
     if percentage >= 80:
-        print("  🌀 BAZINGA IS FULLY OPERATIONAL")
+        lines.append("  🌀 BAZINGA IS FULLY OPERATIONAL")
     elif percentage >= 50:
-        print("  ⚠️  BAZINGA IS PARTIALLY OPERATIONAL")
+        lines.append("  ⚠️  BAZINGA IS PARTIALLY OPERATIONAL")
     else:
-        print("  ❌ BAZINGA NEEDS ATTENTION")
-
-    print()
-    print("  Key insights:")
-    print("  • Solutions emerge at boundary intersections (not search)")
-    print("  • Errors are the arrow of time (learning compass)")
-    print("  • φ = 1.618... is the coherence constant")
-    print("  • V.A.C. = perfect solution state")
-    print()
-    print("  'More compute ≠ better AI. Better boundaries = better AI.'")
-    print()
-    print("=" * 70)
+        lines.append("  ❌ BAZINGA NEEDS ATTENTION")
+
+    lines.extend([
+        "",
+        "  Key insights:",
+        "  • Solutions emerge at boundary intersections (not search)",
+        "  • Errors are the arrow of time (learning compass)",
+        "  • φ = 1.618... is the coherence constant",
+        "  • V.A.C. = perfect solution state",
+        "",
+        "  'More compute ≠ better AI. Better boundaries = better AI.'",
+        "",
+        "=" * 70,
+    ])
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return results
 
 
+
 if __name__ == "__main__":
     asyncio.run(test_all_capabilities())
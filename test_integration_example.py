@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test the integration example's relationship comparison cache
+"""
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(__file__)
+EXAMPLE_PATH = os.path.join(ROOT, "src", "integration-example.py")
+
+# Minimal Meta-Pattern Recognition System: the example only needs these names,
+# and compare_systems counts its calls so cache hits can be checked
+STUB_DETECTOR_SOURCE = '''
+class SystemRepresentation: pass
+class IsomorphismDetector: pass
+class PatternGenerator: pass
+class StatePredictor: pass
+
+class MetaPatternDetector:
+    compare_calls = 0
+
+    def __init__(self, **kwargs):
+        pass
+
+    def compare_systems(self, system_a, system_b):
+        MetaPatternDetector.compare_calls += 1
+        return {
+            "isomorphism_analysis": {"isomorphic": True, "similarity_score": 0.9},
+            "common_patterns": [{"type": "cyclical", "similarity": 0.85}]
+        }
+'''
+
+RELATIONSHIP_A = {
+    "persons": ["A", "B"],
+    "interactions": [
+        {"person_a": "A", "person_b": "B", "context": "conflict", "intensity": 0.7},
+        {"person_a": "B", "person_b": "A", "context": "withdrawal", "intensity": 0.6}
+    ]
+}
+
+RELATIONSHIP_B = {
+    "persons": ["X", "Y"],
+    "interactions": [
+        {"person_a": "X", "person_b": "Y", "context": "criticism", "intensity": 0.6},
+        {"person_a": "Y", "person_b": "X", "context": "defense", "intensity": 0.7}
+    ]
+}
+
+def load_example(monkeypatch, tmp_path):
+    """Load src/integration-example.py against the stub detector module"""
+    stub_path = tmp_path / "meta_pattern_detector.py"
+    stub_path.write_text(STUB_DETECTOR_SOURCE)
+
+    # The example loads the detector from a fixed path next to itself
+    spec_from_file_location = importlib.util.spec_from_file_location
+    def redirect(name, location, *args, **kwargs):
+        if name == "meta_pattern_detector":
+            location = str(stub_path)
+        return spec_from_file_location(name, location, *args, **kwargs)
+    monkeypatch.setattr(importlib.util, "spec_from_file_location", redirect)
+    monkeypatch.setenv("BAZINGA_HOME", str(tmp_path))
+    monkeypatch.setitem(sys.modules, "meta_pattern_detector", None)
+
+    spec = spec_from_file_location("integration_example", EXAMPLE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def test_cached_comparison_is_not_shared(monkeypatch, tmp_path):
+    """Editing a returned comparison must not change later cache hits"""
+    example = load_example(monkeypatch, tmp_path)
+    detector = example.IntegratedDetector()
+    stub = example.MetaPatternDetector
+
+    first = detector.compare_relationship_patterns(RELATIONSHIP_A, RELATIONSHIP_B)
+    assert stub.compare_calls == 1
+    original_score = first["comparison"]["isomorphism_analysis"]["similarity_score"]
+    original_insights = len(first["insights"])
+
+    # Annotate the returned result the way a caller might
+    first["comparison"]["isomorphism_analysis"]["similarity_score"] = -1.0
+    first["comparison"]["common_patterns"].clear()
+    first["insights"].append({"type": "annotation"})
+    first["note"] = "edited"
+
+    second = detector.compare_relationship_patterns(RELATIONSHIP_A, RELATIONSHIP_B)
+    assert stub.compare_calls == 1
+    assert second["comparison"]["isomorphism_analysis"]["similarity_score"] == original_score
+    assert len(second["comparison"]["common_patterns"]) == 1
+    assert len(second["insights"]) == original_insights
+    assert "note" not in second
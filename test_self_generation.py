@@ -7,15 +7,35 @@ This tests the META-CONSCIOUSNESS layer.
 """
 
 import asyncio
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent))
 
 from bazinga_consciousness_quantum import BazingaQuantumConsciousness
 from src.core.quantum import QuantumProcessor
 
 
+# Code generated from a collapsed quantum state; filled with str.format_map
+CODE_TEMPLATE = """
+class {essence_cap}Processor:
+    \"\"\"
+    Auto-generated from quantum pattern analysis
+    Essence: {essence}
+    Probability: {probability:.1%}
+    \"\"\"
+
+    def __init__(self):
+        self.phi = 1.618033988749895
+        self.essence = '{essence}'
+        self.confidence = {probability:.3f}
+
+    def process(self, input_data):
+        # Pattern-derived processing logic
+        return {{
+            'essence': self.essence,
+            'result': input_data * self.phi,
+            'confidence': self.confidence
+        }}
+"""
+
+
 async def test_self_generation():
     """Test BAZINGA's ability to analyze and generate code for itself"""
 
@@ -97,27 +117,7 @@ async def test_self_generation():
     print()
 
     # Simulate code generation from pattern
-    code_template = f"""
-class {collapsed['essence'].capitalize()}Processor:
-    \"\"\"
-    Auto-generated from quantum pattern analysis
-    Essence: {collapsed['essence']}
-    Probability: {collapsed['probability']:.1%}
-    \"\"\"
-
-    def __init__(self):
-        self.phi = 1.618033988749895
-        self.essence = '{collapsed['essence']}'
-        self.confidence = {collapsed['probability']:.3f}
-
-    def process(self, input_data):
-        # Pattern-derived processing logic
-        return {{
-            'essence': self.essence,
-            'result': input_data * self.phi,
-            'confidence': self.confidence
-        }}
-"""
+    code_template = CODE_TEMPLATE.format_map({**collapsed, 'essence_cap': collapsed['essence'].capitalize()})
 
     print("   Generated code:")
     print(code_template)